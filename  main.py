@@ -2,159 +2,241 @@ import requests
 from bs4 import BeautifulSoup
 import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from ratelimit import RateLimiter
 
-def scrape_computrabajo_job(url):
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+LAT_RE = re.compile(r'lat["\']?\s*:\s*([+-]?\d+\.?\d*)')
+
+def scrape_computrabajo_job(url, session=None):
     """
     Scrape job posting data from Computrabajo
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Initialize data dictionary
-        job_data = {
-            'featured_image': None,
-            'title': None,
-            'featured': False,
-            'filled': False,
-            'urgent': False,
-            'description': None,
-            'category': None,
-            'type': None,
-            'tag': None,
-            'expiry_date': None,
-            'gender': None,
-            'apply_type': None,
-            'apply_url': None,
-            'apply_email': None,
-            'salary_type': None,
-            'salary': None,
-            'max_salary': None,
-            'experience': None,
-            'career_level': None,
-            'qualification': None,
-            'video_url': None,
-            'photos': [],
-            'application_deadline_date': None,
-            'address': None,
-            'location': None,
-            'map_location': None,
-            'company': None,
-            'posted_date': None
-        }
-        
-        # Extract title
-        title_tag = soup.find('h1', class_='title_offer')
-        if title_tag:
-            job_data['title'] = title_tag.get_text(strip=True)
-        
-        # Extract company logo/featured image
-        logo_img = soup.find('img', class_='logo')
-        if logo_img and logo_img.get('src'):
-            job_data['featured_image'] = logo_img['src']
-        
-        # Extract company name
-        company_tag = soup.find('a', class_='fc_base')
-        if company_tag:
-            job_data['company'] = company_tag.get_text(strip=True)
-        
-        # Extract location
-        location_tag = soup.find('p', class_='fs16 fc_base mt5')
-        if location_tag:
-            job_data['location'] = location_tag.get_text(strip=True)
-            job_data['address'] = location_tag.get_text(strip=True)
-        
-        # Extract description
-        desc_div = soup.find('div', class_='box_offer fs13')
-        if desc_div:
-            job_data['description'] = desc_div.get_text(strip=True)
-        
-        # Extract salary information
-        salary_tag = soup.find('p', class_='fs16 fwB fc_base')
-        if salary_tag:
-            salary_text = salary_tag.get_text(strip=True)
-            job_data['salary'] = salary_text
-            # Try to parse min/max salary
-            if '-' in salary_text:
-                parts = salary_text.split('-')
-                if len(parts) == 2:
-                    job_data['salary'] = parts[0].strip()
-                    job_data['max_salary'] = parts[1].strip()
-        
-        # Extract job details from the detail boxes
-        detail_boxes = soup.find_all('div', class_='box_detail')
-        for box in detail_boxes:
-            label = box.find('span', class_='tag_color')
-            value = box.find('span', class_='tag_color_value')
-            
-            if label and value:
-                label_text = label.get_text(strip=True).lower()
-                value_text = value.get_text(strip=True)
-                
-                if 'categoría' in label_text or 'category' in label_text:
-                    job_data['category'] = value_text
-                elif 'tipo' in label_text or 'type' in label_text:
-                    job_data['type'] = value_text
-                elif 'experiencia' in label_text or 'experience' in label_text:
-                    job_data['experience'] = value_text
-                elif 'estudios' in label_text or 'qualification' in label_text:
-                    job_data['qualification'] = value_text
-                elif 'publicad' in label_text or 'posted' in label_text:
-                    job_data['posted_date'] = value_text
-        
-        # Check for featured/urgent badges
-        badges = soup.find_all('span', class_='badge')
-        for badge in badges:
-            badge_text = badge.get_text(strip=True).lower()
-            if 'destacad' in badge_text or 'featured' in badge_text:
-                job_data['featured'] = True
-            if 'urgent' in badge_text:
-                job_data['urgent'] = True
-        
-        # Extract apply URL/button
-        apply_btn = soup.find('a', class_='btn_application') or soup.find('button', class_='btn_application')
-        if apply_btn:
-            if apply_btn.get('href'):
-                job_data['apply_url'] = apply_btn['href']
-                job_data['apply_type'] = 'external' if 'http' in apply_btn['href'] else 'internal'
-            else:
-                job_data['apply_type'] = 'internal'
-        
-        # Extract email if present
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, response.text)
-        if emails:
-            job_data['apply_email'] = emails[0]
-        
-        # Extract images
-        images = soup.find_all('img')
-        for img in images:
-            src = img.get('src')
-            if src and 'logo' not in img.get('class', []):
-                job_data['photos'].append(src)
-        
-        # Look for map/location data
-        map_script = soup.find('script', string=re.compile('lat|lng|coordinates'))
-        if map_script:
-            # Try to extract coordinates from script
-            coord_match = re.search(r'lat["\']?\s*:\s*([+-]?\d+\.?\d*)', map_script.string)
-            if coord_match:
-                job_data['map_location'] = coord_match.group(1)
-        
-        return job_data
-        
+        return fetch_computrabajo_job(url, session)
     except Exception as e:
         print(f"Error scraping job: {str(e)}")
         return None
 
+def fetch_computrabajo_job(url, session=None):
+    """
+    Scrape job posting data from Computrabajo, raising on errors
+    
+    Args:
+        url: Offer URL
+        session: requests.Session to reuse connections (None for a one-off request)
+    """
+    response = (session or requests).get(url, headers=HEADERS, timeout=30)
+    response.raise_for_status()
+    soup = BeautifulSoup(response.content, 'html.parser')
+    
+    # Email and image scans only look at the offer content, not the whole page
+    region = soup.find('main') or soup.body or soup
+    
+    # Initialize data dictionary
+    job_data = {
+        'featured_image': None,
+        'title': None,
+        'featured': False,
+        'filled': False,
+        'urgent': False,
+        'description': None,
+        'category': None,
+        'type': None,
+        'tag': None,
+        'expiry_date': None,
+        'gender': None,
+        'apply_type': None,
+        'apply_url': None,
+        'apply_email': None,
+        'salary_type': None,
+        'salary': None,
+        'max_salary': None,
+        'experience': None,
+        'career_level': None,
+        'qualification': None,
+        'video_url': None,
+        'photos': [],
+        'application_deadline_date': None,
+        'address': None,
+        'location': None,
+        'map_location': None,
+        'company': None,
+        'posted_date': None
+    }
+    
+    # Extract title
+    title_tag = soup.find('h1', class_='title_offer')
+    if title_tag:
+        job_data['title'] = title_tag.get_text(strip=True)
+    
+    # Extract company logo/featured image
+    logo_img = soup.find('img', class_='logo')
+    if logo_img and logo_img.get('src'):
+        job_data['featured_image'] = logo_img['src']
+    
+    # Extract company name
+    company_tag = soup.find('a', class_='fc_base')
+    if company_tag:
+        job_data['company'] = company_tag.get_text(strip=True)
+    
+    # Extract location
+    location_tag = soup.find('p', class_='fs16 fc_base mt5')
+    if location_tag:
+        job_data['location'] = location_tag.get_text(strip=True)
+        job_data['address'] = location_tag.get_text(strip=True)
+    
+    # Extract description
+    desc_div = soup.find('div', class_='box_offer fs13')
+    if desc_div:
+        job_data['description'] = desc_div.get_text(strip=True)
+    
+    # Extract salary information
+    salary_tag = soup.find('p', class_='fs16 fwB fc_base')
+    if salary_tag:
+        salary_text = salary_tag.get_text(strip=True)
+        job_data['salary'] = salary_text
+        # Try to parse min/max salary
+        if '-' in salary_text:
+            parts = salary_text.split('-')
+            if len(parts) == 2:
+                job_data['salary'] = parts[0].strip()
+                job_data['max_salary'] = parts[1].strip()
+    
+    # Extract job details from the detail boxes
+    detail_boxes = soup.find_all('div', class_='box_detail')
+    for box in detail_boxes:
+        label = box.find('span', class_='tag_color')
+        value = box.find('span', class_='tag_color_value')
+        
+        if label and value:
+            label_text = label.get_text(strip=True).lower()
+            value_text = value.get_text(strip=True)
+            
+            if 'categoría' in label_text or 'category' in label_text:
+                job_data['category'] = value_text
+            elif 'tipo' in label_text or 'type' in label_text:
+                job_data['type'] = value_text
+            elif 'experiencia' in label_text or 'experience' in label_text:
+                job_data['experience'] = value_text
+            elif 'estudios' in label_text or 'qualification' in label_text:
+                job_data['qualification'] = value_text
+            elif 'publicad' in label_text or 'posted' in label_text:
+                job_data['posted_date'] = value_text
+    
+    # Check for featured/urgent badges
+    badges = soup.find_all('span', class_='badge')
+    for badge in badges:
+        badge_text = badge.get_text(strip=True).lower()
+        if 'destacad' in badge_text or 'featured' in badge_text:
+            job_data['featured'] = True
+        if 'urgent' in badge_text:
+            job_data['urgent'] = True
+    
+    # Extract apply URL/button
+    apply_btn = soup.find('a', class_='btn_application') or soup.find('button', class_='btn_application')
+    if apply_btn:
+        if apply_btn.get('href'):
+            job_data['apply_url'] = apply_btn['href']
+            job_data['apply_type'] = 'external' if 'http' in apply_btn['href'] else 'internal'
+        else:
+            job_data['apply_type'] = 'internal'
+    
+    # Extract email if present
+    mailto = region.find('a', href=re.compile('^mailto:'))
+    if mailto:
+        job_data['apply_email'] = mailto['href'].replace('mailto:', '').split('?')[0]
+    else:
+        email = EMAIL_RE.search(region.get_text(' '))
+        if email:
+            job_data['apply_email'] = email.group(0)
+    
+    # Extract images
+    images = region.find_all('img')
+    for img in images:
+        src = img.get('src')
+        if src and 'logo' not in img.get('class', []):
+            job_data['photos'].append(src)
+    
+    # Look for map/location data
+    map_script = soup.find('script', string=re.compile('lat|lng|coordinates'))
+    if map_script:
+        # Try to extract coordinates from script
+        coord_match = LAT_RE.search(map_script.string)
+        if coord_match:
+            job_data['map_location'] = coord_match.group(1)
+    
+    return job_data
+
+def read_urls(filename):
+    """Read offer URLs from a text file, one per line (blank lines and # comments skipped)"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith('#')]
+
+def scrape_computrabajo_jobs(urls, output='jobs.jsonl', max_workers=8, requests_per_second=2):
+    """
+    Scrape many job postings concurrently, streaming results to JSONL
+    
+    Each output line is {"url", "status", "data"} on success or
+    {"url", "status", "error"} on failure, written as soon as the URL is done.
+    
+    Args:
+        urls: Iterable of offer URLs, or the name of a file with one URL per line
+        output: JSONL file to write results to
+        max_workers: Maximum number of requests in flight
+        requests_per_second: Cap on the request rate across all workers
+    
+    Returns:
+        Tuple of (succeeded, failed) counts
+    """
+    if isinstance(urls, str):
+        urls = read_urls(urls)
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    rate_limiter = RateLimiter(requests_per_second)
+    
+    def fetch(url):
+        rate_limiter.wait()
+        return fetch_computrabajo_job(url, session)
+    
+    succeeded = 0
+    failed = 0
+    with open(output, 'w', encoding='utf-8') as f, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                result = {'url': url, 'status': 'ok', 'data': future.result()}
+                succeeded += 1
+            except Exception as e:
+                result = {'url': url, 'status': 'error', 'error': str(e)}
+                failed += 1
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+            f.flush()
+            print(f"[{succeeded + failed}/{len(futures)}] {result['status']}: {url}")
+    
+    session.close()
+    return succeeded, failed
+
 # Example usage
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Batch mode: python " main.py" urls.txt [output.jsonl]
+    output = sys.argv[2] if len(sys.argv) > 2 else 'jobs.jsonl'
+    succeeded, failed = scrape_computrabajo_jobs(sys.argv[1], output)
+    print(f"\nDone: {succeeded} succeeded, {failed} failed. Results saved to {output}")
+
+elif __name__ == "__main__":
     url = "https://cr.computrabajo.com/ofertas-de-trabajo/oferta-de-trabajo-de-asistente-comercial-en-san-jose-DCF3BCB41ED4C14A61373E686DCF3405"
     
     print("Scraping job posting...")
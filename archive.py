@@ -0,0 +1,182 @@
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from job_record import offer_id
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows, where only the thread lock applies
+    fcntl = None
+
+
+class PageArchive:
+    """Append-only, compressed archive of fetched pages
+
+    Every page is appended to the archive file as its own gzip member (a JSON
+    header line followed by the raw page), so the file stays a valid .gz
+    stream and any record can be decompressed on its own. A SQLite index next
+    to it maps URL and offer ID to the record's offset and length for random
+    access. Detail records also keep the HTML of their listing card, which
+    the extractors need, so pages can be re-extracted without the network.
+    """
+
+    def __init__(self, filename='pages_archive.gz'):
+        self.filename = filename
+        self.lock = threading.Lock()
+        self.index = sqlite3.connect(f'{filename}.idx', timeout=30, check_same_thread=False, isolation_level=None)
+        self.index.row_factory = sqlite3.Row
+        self.index.execute('PRAGMA journal_mode=WAL')
+        self.index.execute(
+            'CREATE TABLE IF NOT EXISTS pages (url TEXT NOT NULL, offer_id TEXT, kind TEXT NOT NULL, '
+            'offset INTEGER NOT NULL, length INTEGER NOT NULL, fetched_at TEXT NOT NULL)'
+        )
+        self.index.execute('CREATE INDEX IF NOT EXISTS idx_pages_url ON pages (url)')
+        self.index.execute('CREATE INDEX IF NOT EXISTS idx_pages_offer_id ON pages (offer_id)')
+
+    def close(self):
+        self.index.close()
+
+    def add(self, url, content, kind, card=None):
+        """Append a fetched page to the archive
+
+        Args:
+            url: Page URL
+            content: Raw page content (bytes)
+            kind: 'listing' or 'detail'
+            card: Listing card the detail page was reached from. None keeps
+                the card of the URL's latest record, as for rechecks, which
+                fetch the page without its card
+        """
+        oid = offer_id({'_job_apply_url': url}) if kind == 'detail' else None
+        fetched_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        header = {'url': url, 'kind': kind, 'offer_id': oid, 'fetched_at': fetched_at}
+        if card is not None:
+            header['card'] = str(card)
+        elif kind == 'detail':
+            latest = self.get(url=url)
+            if latest and 'card' in latest[0]:
+                header['card'] = latest[0]['card']
+        member = gzip.compress(json.dumps(header, ensure_ascii=False).encode('utf-8') + b'\n' + content)
+
+        # The file lock keeps offsets right when several processes share the
+        # archive; it is held until the record is indexed
+        with self.lock, open(self.filename, 'ab') as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0, os.SEEK_END)
+                offset = f.tell()
+                f.write(member)
+                f.flush()
+                self.index.execute(
+                    'INSERT INTO pages (url, offer_id, kind, offset, length, fetched_at) VALUES (?, ?, ?, ?, ?, ?)',
+                    (url, oid, kind, offset, len(member), fetched_at),
+                )
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def get(self, url=None, oid=None):
+        """Get the latest archived (header, content) for a URL or offer ID, or None"""
+        column, value = ('url', url) if url else ('offer_id', oid)
+        row = self.index.execute(
+            f'SELECT offset, length FROM pages WHERE {column} = ? ORDER BY offset DESC LIMIT 1', (value,)
+        ).fetchone()
+        return read_record(self.filename, row['offset'], row['length']) if row else None
+
+    def latest_records(self, kind):
+        """Get (offset, length) of the latest record of each URL of the given kind"""
+        rows = self.index.execute(
+            'SELECT MAX(offset) AS offset, length FROM pages WHERE kind = ? GROUP BY url ORDER BY offset',
+            (kind,),
+        )
+        return [(row['offset'], row['length']) for row in rows]
+
+
+def read_record(filename, offset, length):
+    """Read and decompress one archive record
+
+    Returns:
+        Tuple of (header dict, raw page content)
+    """
+    with open(filename, 'rb') as f:
+        f.seek(offset)
+        data = zlib.decompress(f.read(length), wbits=31)
+    header, content = data.split(b'\n', 1)
+    return json.loads(header), content
+
+
+_scraper = None
+
+
+def _extract_records(filename, records):
+    """Re-extract jobs from a chunk of detail records (runs in a worker process)"""
+    global _scraper
+    if _scraper is None:
+        from scraper import ComputrabajoScraper
+        _scraper = ComputrabajoScraper()
+
+    jobs = []
+    for offset, length in records:
+        header, content = read_record(filename, offset, length)
+        card = BeautifulSoup(header.get('card', ''), 'html.parser')
+        # Placeholder deadlines count from the original fetch, not from today
+        fetched_at = datetime.strptime(header['fetched_at'], '%Y-%m-%d %H:%M:%S')
+        try:
+            jobs.append(_scraper.extract_job_details(header['url'], content, card, fetched_at))
+        except Exception as e:
+            print(f"Error re-extracting {header['url']}: {e}")
+    return jobs
+
+
+def reextract(filename='pages_archive.gz', workers=None, chunk_size=200):
+    """Run the current extractors over every archived detail page in parallel
+
+    Args:
+        filename: Archive file
+        workers: Number of worker processes (None for one per core)
+        chunk_size: Records handed to a worker at a time
+
+    Returns:
+        List of job dicts, in archive order
+    """
+    archive = PageArchive(filename)
+    records = archive.latest_records('detail')
+    archive.close()
+
+    chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+    jobs = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_jobs in executor.map(_extract_records, [filename] * len(chunks), chunks):
+            jobs.extend(chunk_jobs)
+    return jobs
+
+
+# Usage
+if __name__ == "__main__":
+    from scraper import ComputrabajoScraper
+
+    parser = argparse.ArgumentParser(description="Rebuild the job dataset from archived pages")
+    parser.add_argument('command', choices=['reextract'])
+    parser.add_argument('archive', nargs='?', default='pages_archive.gz')
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument('--output', default='jobs_reextracted.json', help="JSON file to write")
+    args = parser.parse_args()
+
+    start = datetime.now()
+    jobs = reextract(args.archive, workers=args.workers)
+    print(f"✓ Re-extracted {len(jobs)} jobs from {args.archive} in {(datetime.now() - start).total_seconds():.1f}s")
+
+    scraper = ComputrabajoScraper()
+    scraper.save_to_json(jobs, args.output)
+    scraper.save_to_csv(jobs, os.path.splitext(args.output)[0] + '.csv')
@@ -0,0 +1,194 @@
+import argparse
+import heapq
+import itertools
+import time
+from datetime import datetime, timedelta
+
+from job_record import default_deadline_on, offer_id
+from scraper import ComputrabajoScraper
+from search import JobSearchIndex
+from storage import SQLiteJobStore
+
+# Fields read from the listing card rather than the detail page; kept from
+# the stored job when an offer is rechecked without its card
+CARD_FIELDS = ('_job_featured', '_job_urgent')
+
+# Fields whose extractors fall back to the listing card; the stored value is
+# kept when a recheck without the card leaves them empty
+CARD_FALLBACK_FIELDS = ('_job_title', '_job_address', '_job_location', '_job_map_location')
+
+
+class RecrawlScheduler:
+    """Long-running recrawl loop driven by a freshness priority queue
+
+    The queue holds listing pages and known offers, ordered by when each is
+    next due. The first listing pages are polled often to catch new postings
+    (page N every N x `listing_interval`). Known offers are rechecked for
+    closure at an interval proportional to their age, so fresh offers are
+    looked at often and old ones rarely. All requests share the scraper's
+    rate limiter, which caps the total request rate.
+    """
+
+    def __init__(self, scraper, base_url, db='jobs_computrabajo.db', listing_pages=3,
+                 listing_interval=600, recheck_factor=0.5, min_recheck=3600, max_recheck=86400):
+        """
+        Args:
+            scraper: ComputrabajoScraper used for fetching and extraction
+            base_url: Listing URL to watch
+            db: SQLite database the jobs are stored in
+            listing_pages: Number of listing pages to poll
+            listing_interval: Seconds between polls of the first listing page
+            recheck_factor: Recheck interval as a fraction of the offer's age
+            min_recheck: Shortest recheck interval for an offer, in seconds
+            max_recheck: Longest recheck interval for an offer, in seconds
+        """
+        self.scraper = scraper
+        self.base_url = base_url
+        self.listing_pages = listing_pages
+        self.listing_interval = listing_interval
+        self.recheck_factor = recheck_factor
+        self.min_recheck = min_recheck
+        self.max_recheck = max_recheck
+        self.store = SQLiteJobStore(db)
+        self.index = JobSearchIndex(db)
+
+        self.queue = []
+        self.counter = itertools.count()
+        # Offer URL -> estimated publication time
+        self.known = {}
+
+    def schedule(self, due, kind, url):
+        heapq.heappush(self.queue, (due, next(self.counter), kind, url))
+
+    def recheck_delay(self, url):
+        """Seconds until an offer should be rechecked, based on its age"""
+        age = (datetime.now() - self.known[url]).total_seconds()
+        return min(self.max_recheck, max(self.min_recheck, age * self.recheck_factor))
+
+    def load_known_offers(self):
+        """Queue rechecks for the open offers already in the database"""
+        now = time.time()
+        for job, first_seen in self.store.get_open_jobs():
+            url = job['_job_apply_url']
+            self.known[url] = datetime.strptime(first_seen, '%Y-%m-%d %H:%M:%S')
+            self.schedule(now + self.recheck_delay(url), 'offer', url)
+        print(f"Loaded {len(self.known)} open offers from {self.store.filename}")
+
+    def run(self, max_tasks=None):
+        """Process queued tasks as they fall due
+
+        Args:
+            max_tasks: Stop after this many tasks (None to run forever)
+        """
+        self.load_known_offers()
+        now = time.time()
+        for page in range(1, self.listing_pages + 1):
+            self.schedule(now, 'listing', page)
+
+        for _ in itertools.count() if max_tasks is None else range(max_tasks):
+            due, _, kind, target = heapq.heappop(self.queue)
+            delay = due - time.time()
+            if delay > 0:
+                time.sleep(delay)
+
+            try:
+                if kind == 'listing':
+                    self.poll_listing(target)
+                else:
+                    self.recheck_offer(target)
+            except Exception as e:
+                print(f"Error processing {kind} {target}: {e}")
+                if kind == 'offer':
+                    self.schedule(time.time() + self.min_recheck, kind, target)
+
+            if kind == 'listing':
+                self.schedule(time.time() + self.listing_interval * target, kind, target)
+
+    def poll_listing(self, page):
+        """Scrape offers on a listing page that are neither known nor closed"""
+        url = self.scraper.page_url(self.base_url, page)
+        fetched_at = datetime.now()
+        soup, cards = self.scraper.fetch_listing_cards(url)
+
+        new_jobs = []
+        for card in cards:
+            job_url = self.scraper.get_job_url(card)
+            if not job_url or job_url in self.known or self.is_closed(job_url):
+                continue
+            try:
+                job = self.scraper.scrape_job_details(job_url, card, fetched_at)
+            except Exception as e:
+                print(f"Error scraping {job_url}: {e}")
+                continue
+            new_jobs.append(job)
+            age = self.scraper.get_posting_age(card) or timedelta(0)
+            self.known[job_url] = datetime.now() - age
+            self.schedule(time.time() + self.recheck_delay(job_url), 'offer', job_url)
+
+        self.save(new_jobs, fetched_at)
+        print(f"Listing page {page}: {len(new_jobs)} new offers")
+
+    def recheck_offer(self, url):
+        """Refresh a known offer, marking it filled once it has closed"""
+        stored = self.store.get_job(offer_id({'_job_apply_url': url}))
+        fetched_at = datetime.now()
+        # Error responses raise and leave the stored job alone; run() reschedules
+        closed, job = self.scraper.check_offer(url, fetched_at)
+        if job and stored:
+            kept = {field: stored[field] for field in CARD_FIELDS}
+            kept.update({field: stored[field] for field in CARD_FALLBACK_FIELDS if not job[field]})
+            job = dict(job, **kept)
+        elif job is None and stored:
+            job = dict(stored, _job_filled='1')
+
+        if job:
+            self.save([job], fetched_at)
+        if closed:
+            print(f"Offer closed: {url}")
+            del self.known[url]
+        else:
+            self.schedule(time.time() + self.recheck_delay(url), 'offer', url)
+
+    def is_closed(self, url):
+        """Check whether an offer is stored as filled"""
+        stored = self.store.get_job(offer_id({'_job_apply_url': url}))
+        return bool(stored) and stored['_job_filled'] == '1'
+
+    def save(self, jobs, fetched_at):
+        """Store jobs fetched at `fetched_at` and index the changed ones"""
+        changed = self.store.upsert_jobs(jobs, default_deadlines={default_deadline_on(fetched_at)})
+        self.index.update(changed)
+
+
+# Usage
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Continuously recrawl Computrabajo listings and offers")
+    parser.add_argument('base_url', nargs='?', default="https://cr.computrabajo.com/empleos-en-san-jose")
+    parser.add_argument('--db', default='jobs_computrabajo.db', help="SQLite database to store jobs in")
+    parser.add_argument('--listing-pages', type=int, default=3, help="Number of listing pages to poll")
+    parser.add_argument('--listing-interval', type=int, default=600,
+                        help="Seconds between polls of the first listing page")
+    parser.add_argument('--max-requests-per-minute', type=float, default=20,
+                        help="Cap on the total request rate")
+    parser.add_argument('--archive', nargs='?', const='pages_archive.gz', default=None,
+                        help="Archive fetched pages to this file (default: pages_archive.gz)")
+    args = parser.parse_args()
+
+    archive = None
+    if args.archive:
+        from archive import PageArchive
+        archive = PageArchive(args.archive)
+    scraper = ComputrabajoScraper(requests_per_second=args.max_requests_per_minute / 60, archive=archive)
+    scheduler = RecrawlScheduler(
+        scraper,
+        args.base_url,
+        db=args.db,
+        listing_pages=args.listing_pages,
+        listing_interval=args.listing_interval,
+    )
+
+    print("=" * 60)
+    print("Computrabajo Job Scraper - Daemon Mode")
+    print(f"Watching {args.base_url}")
+    print("=" * 60)
+    scheduler.run()
@@ -0,0 +1,125 @@
+import json
+import os
+from collections import Counter
+
+from job_record import JOB_FIELDS, VOLATILE_FIELDS, content_values, offer_id, to_json_default
+
+
+def compute_delta(previous, current, previous_deadlines=(), current_deadlines=(), is_closed=None):
+    """Compare two runs of scraped jobs by offer ID and content
+
+    Args:
+        previous: Jobs from the previous snapshot
+        current: Jobs from this run
+        previous_deadlines: Placeholder deadlines of the previous run
+        current_deadlines: Placeholder deadlines of this run
+        is_closed: Callable taking a previous job missing from this run and
+            returning whether the offer is confirmed closed. None counts
+            every missing offer as closed, which only holds when `current`
+            is a complete crawl.
+
+    Returns:
+        Tuple of (added, updated, closed). `added` holds full records,
+        `updated` holds `_job_apply_url` plus only the fields that changed,
+        and `closed` holds `_job_apply_url` with `_job_filled` set to '1' for
+        offers that are no longer listed.
+    """
+    previous_by_id = {offer_id(job): job for job in previous}
+    current_by_id = {offer_id(job): job for job in current}
+
+    added = []
+    updated = []
+    for oid, job in current_by_id.items():
+        old = previous_by_id.get(oid)
+        if old is None:
+            added.append(job)
+            continue
+        old_values = content_values(old, previous_deadlines)
+        new_values = content_values(job, current_deadlines)
+        changes = {field: job.get(field, '') for field in JOB_FIELDS if old_values[field] != new_values[field]}
+        if changes:
+            updated.append(dict({'_job_apply_url': job['_job_apply_url']}, **changes))
+
+    missing = [
+        job for oid, job in previous_by_id.items()
+        if oid not in current_by_id and job.get('_job_filled') != '1'
+    ]
+    closed = [
+        {'_job_apply_url': job['_job_apply_url'], '_job_filled': '1'}
+        for job in missing
+        if is_closed is None or is_closed(job)
+    ]
+    return added, updated, closed
+
+
+def load_baseline(filename):
+    """Load a delta baseline
+
+    Args:
+        filename: Baseline written by save_baseline, or a plain list of jobs
+            such as a `jobs_computrabajo.json` export. A plain list records
+            no placeholder, so its most common deadline is taken as one.
+
+    Returns:
+        Tuple of (jobs, placeholder deadlines)
+    """
+    with open(filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return data['jobs'], tuple(data['default_deadlines'])
+
+    deadlines = Counter(
+        job.get('_job_expiry_date') for job in data
+        if job.get('_job_expiry_date') and job.get('_job_expiry_date') == job.get('_job_application_deadline_date')
+    )
+    return data, tuple(deadline for deadline, count in deadlines.most_common(1))
+
+
+def save_baseline(filename, jobs, default_deadlines):
+    """Write the jobs the next run is compared against, with their placeholder deadlines"""
+    baseline = {'default_deadlines': sorted(default_deadlines), 'jobs': list(jobs)}
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2, default=to_json_default)
+
+
+def export_delta(jobs, baseline_file='jobs_delta_baseline.json', prefix='jobs_delta', default_deadlines=(),
+                 is_closed=None, seed_file='jobs_computrabajo.json'):
+    """Write added/updated/closed delta files against the previous run
+
+    The previous run is read from the baseline file, which is then replaced
+    with this run's jobs plus the open offers that were missing from it but
+    not confirmed closed, so they can still be reported closed later. When
+    there is no baseline yet, `seed_file` is used; when neither exists every
+    job counts as added.
+
+    Args:
+        jobs: Jobs from this run
+        baseline_file: Baseline kept between runs
+        prefix: Prefix of the delta files (`<prefix>_added.json`, ...)
+        default_deadlines: Placeholder deadlines of this run
+        is_closed: Closure check for offers missing from this run, as in
+            compute_delta
+        seed_file: JSON export used as the baseline when there is none yet
+
+    Returns:
+        Tuple of (added, updated, closed) as returned by compute_delta
+    """
+    previous = []
+    previous_deadlines = ()
+    for filename in (baseline_file, seed_file):
+        if filename and os.path.exists(filename):
+            previous, previous_deadlines = load_baseline(filename)
+            break
+
+    delta = compute_delta(previous, jobs, previous_deadlines, tuple(default_deadlines), is_closed)
+    for name, records in zip(('added', 'updated', 'closed'), delta):
+        with open(f'{prefix}_{name}.json', 'w', encoding='utf-8') as f:
+            json.dump(records, f, ensure_ascii=False, indent=2, default=to_json_default)
+
+    listed_or_closed = {offer_id(job) for job in jobs} | {offer_id(job) for job in delta[2]}
+    carried = [job for job in previous if offer_id(job) not in listed_or_closed and job.get('_job_filled') != '1']
+    carried_deadlines = {
+        job.get(field) for job in carried for field in VOLATILE_FIELDS if job.get(field) in previous_deadlines
+    }
+    save_baseline(baseline_file, list(jobs) + carried, set(default_deadlines) | carried_deadlines)
+    return delta
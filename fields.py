@@ -0,0 +1,99 @@
+import re
+import unicodedata
+
+# Combining marks left over after NFKD decomposition (the accents in "José")
+COMBINING_PATTERN = r'[\u0300-\u036f]'
+COMBINING_RE = re.compile(COMBINING_PATTERN)
+
+# Colón amounts such as "310 000,00" or "1.500.000"; group 1 is the whole
+# part. Amounts under 1000 are not matched, to skip stray numbers like
+# "(2 turnos)".
+SALARY_AMOUNT_PATTERN = r'(\d{1,3}(?:[ .\u00a0]\d{3})+|\d{4,})(?:,\d{1,2})?'
+SALARY_AMOUNT_RE = re.compile(SALARY_AMOUNT_PATTERN)
+THOUSANDS_SEPARATOR_PATTERN = r'[ .\u00a0]'
+THOUSANDS_SEPARATOR_RE = re.compile(THOUSANDS_SEPARATOR_PATTERN)
+
+PROVINCES = {
+    'san jose': 'San José',
+    'alajuela': 'Alajuela',
+    'cartago': 'Cartago',
+    'heredia': 'Heredia',
+    'guanacaste': 'Guanacaste',
+    'puntarenas': 'Puntarenas',
+    'limon': 'Limón',
+}
+PROVINCE_PATTERN = '(' + '|'.join(PROVINCES) + ')'
+PROVINCE_RE = re.compile(PROVINCE_PATTERN)
+
+CANTONS = {
+    'San José': (
+        'san jose', 'escazu', 'desamparados', 'puriscal', 'tarrazu', 'aserri', 'mora',
+        'goicoechea', 'santa ana', 'alajuelita', 'vazquez de coronado', 'coronado', 'acosta',
+        'tibas', 'moravia', 'montes de oca', 'turrubares', 'dota', 'curridabat',
+        'perez zeledon', 'leon cortes', 'leon cortes castro',
+    ),
+    'Alajuela': (
+        'alajuela', 'san ramon', 'grecia', 'san mateo', 'atenas', 'naranjo', 'palmares',
+        'poas', 'orotina', 'san carlos', 'zarcero', 'sarchi', 'valverde vega', 'upala',
+        'los chiles', 'guatuso', 'rio cuarto',
+    ),
+    'Cartago': (
+        'cartago', 'paraiso', 'la union', 'jimenez', 'turrialba', 'alvarado', 'oreamuno',
+        'el guarco',
+    ),
+    'Heredia': (
+        'heredia', 'barva', 'santo domingo', 'santa barbara', 'san rafael', 'san isidro',
+        'belen', 'flores', 'san pablo', 'sarapiqui',
+    ),
+    'Guanacaste': (
+        'liberia', 'nicoya', 'santa cruz', 'bagaces', 'carrillo', 'canas', 'abangares',
+        'tilaran', 'nandayure', 'la cruz', 'hojancha',
+    ),
+    'Puntarenas': (
+        'puntarenas', 'esparza', 'buenos aires', 'montes de oro', 'osa', 'quepos', 'golfito',
+        'coto brus', 'parrita', 'corredores', 'garabito', 'monteverde', 'puerto jimenez',
+    ),
+    'Limón': (
+        'limon', 'pococi', 'siquirres', 'talamanca', 'matina', 'guacimo',
+    ),
+}
+
+CANTON_TO_PROVINCE = {canton: province for province, cantons in CANTONS.items() for canton in cantons}
+
+
+def fold(text):
+    """Lowercase text and strip accents (`Limón` -> `limon`)"""
+    return COMBINING_RE.sub('', unicodedata.normalize('NFKD', text or '')).lower().strip()
+
+
+def parse_salary(text):
+    """Parse a salary string into (min, max) colones, or (None, None)
+
+    `"310 000,00 ₡  + Comisiones"` gives (310000, 310000); `"A convenir"`
+    gives (None, None).
+    """
+    amounts = [int(THOUSANDS_SEPARATOR_RE.sub('', amount)) for amount in SALARY_AMOUNT_RE.findall(text or '')]
+    if not amounts:
+        return None, None
+    return min(amounts), max(amounts)
+
+
+def province_of(location, *fallbacks):
+    """Get the canonical province of a location (canton or province name)
+
+    Args:
+        location: `_job_location` value
+        fallbacks: Further texts searched for a province name when the
+            location is not a known canton, e.g. `_job_address`
+
+    Returns:
+        Province name such as 'San José', or '' if none was found
+    """
+    province = CANTON_TO_PROVINCE.get(fold(location))
+    if province:
+        return province
+    for text in (location,) + fallbacks:
+        match = PROVINCE_RE.search(fold(text))
+        if match:
+            return PROVINCES[match.group(1)]
+    return ''
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import re
+from collections.abc import Mapping
+from datetime import timedelta
+
+JOB_FIELDS = (
+    '_job_featured_image',
+    '_job_title',
+    '_job_featured',
+    '_job_filled',
+    '_job_urgent',
+    '_job_description',
+    '_job_category',
+    '_job_type',
+    '_job_tag',
+    '_job_expiry_date',
+    '_job_gender',
+    '_job_apply_type',
+    '_job_apply_url',
+    '_job_apply_email',
+    '_job_salary_type',
+    '_job_salary',
+    '_job_max_salary',
+    '_job_experience',
+    '_job_career_level',
+    '_job_qualification',
+    '_job_video_url',
+    '_job_photos',
+    '_job_application_deadline_date',
+    '_job_address',
+    '_job_location',
+    '_job_map_location',
+)
+
+# Fields that only take a handful of distinct values across a result set
+# (flags, constants, logo URLs, locations...). Their values are pooled so
+# every record points at one shared string instead of holding its own copy.
+# Free-text fields are left out: they rarely repeat and would only grow the pool.
+INTERNED_FIELDS = frozenset((
+    '_job_featured_image',
+    '_job_featured',
+    '_job_filled',
+    '_job_urgent',
+    '_job_type',
+    '_job_tag',
+    '_job_expiry_date',
+    '_job_gender',
+    '_job_apply_type',
+    '_job_salary_type',
+    '_job_application_deadline_date',
+    '_job_address',
+    '_job_location',
+    '_job_map_location',
+))
+
+# Shared value pool for INTERNED_FIELDS. A plain dict rather than sys.intern,
+# so pooled strings are not made immortal by the interpreter.
+_value_pool = {}
+
+OFFER_ID_RE = re.compile(r'-([0-9A-F]{32})(?:[/?#]|$)', re.I)
+
+# Deadline fields: they hold the offer's validThrough when it has one, and
+# otherwise a placeholder stamped at scrape time that moves with every run
+VOLATILE_FIELDS = frozenset(('_job_expiry_date', '_job_application_deadline_date'))
+
+# Days after the scrape date used as the placeholder deadline
+DEFAULT_DEADLINE_DAYS = 30
+
+
+class JobRecord(Mapping):
+    """Compact, read-only job record
+
+    Holds the same `_job_*` fields as the dicts returned by the scraper, but
+    stores them in slots and interns low-cardinality values. Behaves like a
+    mapping, so it can be used wherever a job dict is read and serializes to
+    the same JSON/CSV.
+    """
+    __slots__ = JOB_FIELDS
+
+    def __init__(self, **fields):
+        for field in JOB_FIELDS:
+            value = fields.get(field, '')
+            if field in INTERNED_FIELDS and type(value) is str:
+                value = _value_pool.setdefault(value, value)
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("JobRecord is read-only")
+
+    def __getitem__(self, key):
+        if key not in JOB_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(JOB_FIELDS)
+
+    def __len__(self):
+        return len(JOB_FIELDS)
+
+    def __repr__(self):
+        return f"JobRecord({self['_job_title']!r}, {self['_job_apply_url']!r})"
+
+    def __reduce__(self):
+        return (_from_items, (tuple(self.values()),))
+
+    @classmethod
+    def from_dict(cls, job):
+        """Build a record from a scraped job dict"""
+        return cls(**job)
+
+    def to_dict(self):
+        """Return the record as a plain job dict"""
+        return {field: getattr(self, field) for field in JOB_FIELDS}
+
+
+def _from_items(values):
+    return JobRecord(**dict(zip(JOB_FIELDS, values)))
+
+
+def to_json_default(obj):
+    """`json.dump` hook that serializes JobRecord instances as plain dicts"""
+    if isinstance(obj, JobRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def load_records(filename='jobs_computrabajo.json'):
+    """Load a JSON export as a list of compact JobRecord objects"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        return json.load(f, object_hook=lambda job: JobRecord.from_dict(job) if '_job_apply_url' in job else job)
+
+
+def offer_id(job):
+    """Get the Computrabajo offer ID from a job's `_job_apply_url`"""
+    url = job.get('_job_apply_url', '')
+    match = OFFER_ID_RE.search(url)
+    if match:
+        return match.group(1).upper()
+    return url.split('#')[0].split('?')[0].rstrip('/').rsplit('/', 1)[-1]
+
+
+def default_deadline_on(day):
+    """Get the placeholder deadline written by a scrape run started at `day`"""
+    return (day + timedelta(days=DEFAULT_DEADLINE_DAYS)).strftime('%Y-%m-%d')
+
+
+def content_values(job, default_deadlines=()):
+    """Get the offer content of a job as a field -> string dict
+
+    Args:
+        job: Job dict or JobRecord
+        default_deadlines: Placeholder deadlines of the run the job was
+            scraped in; deadline fields holding one are blanked, so only a
+            real validThrough counts as content
+    """
+    values = {}
+    for field in JOB_FIELDS:
+        value = str(job.get(field, ''))
+        if field in VOLATILE_FIELDS and value in default_deadlines:
+            value = ''
+        values[field] = value
+    return values
+
+
+def content_hash(job, default_deadlines=()):
+    """Hash the offer content of a job, as given by content_values"""
+    digest = hashlib.sha1()
+    for value in content_values(job, default_deadlines).values():
+        digest.update(value.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
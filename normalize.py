@@ -0,0 +1,125 @@
+import json
+import sys
+
+import pandas as pd
+
+from fields import (
+    CANTON_TO_PROVINCE,
+    COMBINING_PATTERN,
+    PROVINCE_PATTERN,
+    PROVINCES,
+    SALARY_AMOUNT_PATTERN,
+    THOUSANDS_SEPARATOR_PATTERN,
+)
+
+EXPERIENCE_PATTERN = r'(?P<less>menos de\s*)?(?P<years>\d+)(?:\s*(?:-|a)\s*\d+)?\s*anos?'
+EXPERIENCE_MONTHS_PATTERN = r'(\d+)\s*mes(?:es)?\b'
+JUNK_CATEGORY_PATTERN = r'^(?:gracias por ayudarnos|descripcion de la oferta)'
+
+
+def fold(series):
+    """Vectorized `fields.fold`: lowercase a string Series and strip accents"""
+    return (
+        series.fillna('')
+        .astype(str)
+        .str.normalize('NFKD')
+        .str.replace(COMBINING_PATTERN, '', regex=True)
+        .str.lower()
+        .str.strip()
+    )
+
+
+def normalize_salary(salary, salary_type):
+    """Parse raw salary strings into numeric min/max and a pay period
+
+    Args:
+        salary: Series of `_job_salary` strings such as "310 000,00 ₡  + Comisiones"
+        salary_type: Series of `_job_salary_type` values used as the default period
+
+    Returns:
+        DataFrame with `salary_min`, `salary_max` (nullable ints) and `salary_period`
+    """
+    amounts = (
+        salary.fillna('').astype(str)
+        .str.extractall(SALARY_AMOUNT_PATTERN)[0]
+        .str.replace(THOUSANDS_SEPARATOR_PATTERN, '', regex=True)
+        .astype('int64')
+    )
+    grouped = amounts.groupby(level=0)
+    result = pd.DataFrame({
+        'salary_min': grouped.min().reindex(salary.index).astype('Int64'),
+        'salary_max': grouped.max().reindex(salary.index).astype('Int64'),
+    })
+
+    folded = fold(salary)
+    period = fold(salary_type).replace('', pd.NA)
+    period = period.mask(folded.str.contains('hora'), 'hora')
+    period = period.mask(folded.str.contains('anual'), 'anual')
+    result['salary_period'] = period.where(result['salary_min'].notna())
+    return result
+
+
+def normalize_experience(experience):
+    """Parse free-text experience into whole years
+
+    "10 años de experiencia" gives 10, "2-3 años" gives 2, "Menos de 1 año"
+    and "6 meses" give 0. Text without a year or month count gives <NA>.
+    """
+    folded = fold(experience)
+    parts = folded.str.extract(EXPERIENCE_PATTERN)
+    years = pd.to_numeric(parts['years']).astype('Int64')
+    years = years.mask(parts['less'].notna(), (years - 1).clip(lower=0))
+    months = pd.to_numeric(folded.str.extract(EXPERIENCE_MONTHS_PATTERN)[0]).astype('Int64')
+    years = years.fillna(months // 12)
+    return years.mask(folded.str.contains('sin experiencia'), 0)
+
+
+def normalize_province(location, *fallbacks):
+    """Map locations (cantons or provinces) to canonical province names
+
+    Args:
+        location: Series of `_job_location` values
+        fallbacks: Further Series searched for a province name when the
+            location is not a known canton, e.g. `_job_address`
+    """
+    province = fold(location).map(CANTON_TO_PROVINCE)
+    for series in (location,) + fallbacks:
+        found = fold(series).str.extract(PROVINCE_PATTERN)[0].map(PROVINCES)
+        province = province.fillna(found)
+    return province
+
+
+def normalize_category(category):
+    """Blank out scraped categories that are page boilerplate"""
+    return category.where(~fold(category).str.contains(JUNK_CATEGORY_PATTERN), pd.NA)
+
+
+def normalize_jobs(jobs):
+    """Normalize a whole result set in one pass
+
+    Args:
+        jobs: Iterable of job dicts or JobRecord objects, or a DataFrame
+
+    Returns:
+        DataFrame with the original `_job_*` columns plus typed `salary_min`,
+        `salary_max`, `salary_period`, `experience_years`, `province` and a
+        cleaned `category` column
+    """
+    df = jobs if isinstance(jobs, pd.DataFrame) else pd.DataFrame([dict(job) for job in jobs])
+    df = df.join(normalize_salary(df['_job_salary'], df['_job_salary_type']))
+    df['experience_years'] = normalize_experience(df['_job_experience'])
+    df['province'] = normalize_province(df['_job_location'], df['_job_address'], df['_job_title'])
+    df['category'] = normalize_category(df['_job_category'])
+    return df
+
+
+# Usage
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else 'jobs_computrabajo.json'
+    target = sys.argv[2] if len(sys.argv) > 2 else 'jobs_normalized.csv'
+
+    with open(source, 'r', encoding='utf-8') as f:
+        df = normalize_jobs(json.load(f))
+
+    df.to_csv(target, index=False, encoding='utf-8-sig')
+    print(f"✓ Normalized {len(df)} jobs from {source} to {target}")
@@ -0,0 +1,19 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Spaces out requests, across threads, to at most `rate` per second"""
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self.lock = threading.Lock()
+        self.next_time = 0
+
+    def wait(self):
+        """Block until the next request is allowed"""
+        with self.lock:
+            current = time.monotonic()
+            delay = self.next_time - current
+            self.next_time = max(current, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
@@ -1,15 +1,77 @@
+import argparse
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import re
 from datetime import datetime, timedelta
+import math
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from delta import export_delta
+from job_record import JobRecord, default_deadline_on, to_json_default
+from ratelimit import RateLimiter
+from search import JobSearchIndex
+from storage import SQLiteJobStore
 
 now = datetime.now()
-default_deadline = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
+
+# Regions of interest for scoped parsing: the job cards on listing pages, and
+# the offer content plus page-level meta tags and images on detail pages
+LISTING_REGION = SoupStrainer('article')
+DETAIL_REGION = SoupStrainer(['main', 'meta', 'img'])
+
+# JSON-LD blocks are sliced from the raw page, so no <script> tree (analytics
+# included) is ever built for them
+LD_JSON_RE = re.compile(
+    rb'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.I | re.S
+)
+
+# Fields whose fallback is a constant or a listing-card flag rather than a
+# detail-page extractor; only their structured values count as a source
+UNEXTRACTED_FIELDS = frozenset((
+    '_job_featured', '_job_urgent', '_job_tag', '_job_expiry_date', '_job_apply_type',
+    '_job_apply_url', '_job_application_deadline_date',
+))
+
+EMPLOYMENT_TYPES = {
+    'FULL_TIME': 'Tiempo Completo',
+    'PART_TIME': 'Medio Tiempo',
+    'TEMPORARY': 'Temporal',
+    'PER_DIEM': 'Por Horas',
+}
+
+SALARY_UNITS = {
+    'HOUR': 'hora',
+    'MONTH': 'mensual',
+    'YEAR': 'anual',
+}
+
+POSTING_AGE_RE = re.compile(r'Hace\s+(\d+|una?)\s+(minuto|hora|d[ií]a|semana|mes)', re.I)
+POSTING_AGE_UNITS = {
+    'minuto': timedelta(minutes=1),
+    'hora': timedelta(hours=1),
+    'd': timedelta(days=1),
+    'semana': timedelta(weeks=1),
+    'mes': timedelta(days=30),
+}
 
 class ComputrabajoScraper:
-    def __init__(self):
+    def __init__(self, compact_records=False, scoped_parsing=False, max_workers=4, requests_per_second=2,
+                 archive=None):
+        """
+        Args:
+            compact_records: Return JobRecord objects instead of dicts to
+                cut per-job memory when holding large result sets
+            scoped_parsing: Only build trees for the listing articles and
+                detail content regions, falling back to a full parse when
+                the scoped parse finds nothing. Opt-in: detail fields
+                rendered outside <main> are lost when it is on
+            max_workers: Number of listing pages fetched concurrently
+            requests_per_second: Cap on the request rate across all threads
+            archive: PageArchive every fetched listing and detail page is
+                written to, for offline re-extraction (None to disable)
+        """
         self.base_url = "https://cr.computrabajo.com"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -19,10 +81,107 @@ class ComputrabajoScraper:
             'Connection': 'keep-alive',
         }
         self.session = requests.Session()
+        self.compact_records = compact_records
+        self.scoped_parsing = scoped_parsing
+        self.field_sources = Counter()
+        # Placeholder deadlines written so far, one per scrape date
+        self.default_deadlines = set()
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.archive = archive
     
     def scrape_all_pages(self, base_url, max_pages=None, max_jobs=None):
         """Scrape all pages with pagination
         
+        The total offer count (or last page number) is read from the first
+        listing page. The listing pages needed are fetched concurrently, a
+        window of max_workers pages at a time, and job details are scraped
+        page by page. Further pages are fetched when skipped jobs leave the
+        run short of max_jobs. When the first page does not reveal the page
+        count, pages are probed one by one instead.
+        
+        Args:
+            base_url: Starting URL
+            max_pages: Maximum number of pages to scrape (None for unlimited)
+            max_jobs: Maximum number of jobs to scrape (None for unlimited)
+        """
+        print(f"\n{'='*60}")
+        print("Discovering listing pages")
+        print(f"{'='*60}")
+        
+        soup, first_cards = self.fetch_listing_cards(base_url, full_page=True)
+        page_count = self.get_page_count(soup, len(first_cards)) if soup else None
+        
+        if not page_count:
+            print("Could not read the number of pages, probing pages one by one.")
+            return self.scrape_pages_sequentially(base_url, max_pages, max_jobs)
+        
+        print(f"Listing has {page_count} pages")
+        last_page = min(page_count, max_pages) if max_pages else page_count
+        page_size = len(first_cards)
+        planned_pages = last_page
+        if max_jobs:
+            planned_pages = min(last_page, math.ceil(max_jobs / page_size))
+        print(f"Planning {planned_pages} listing pages")
+        
+        # Listing pages are fetched in windows of max_workers pages, so only
+        # a few parsed pages are held while their details are scraped
+        pending = [first_cards]
+        del soup, first_cards
+        all_jobs = []
+        page = 0
+        while True:
+            if max_jobs and len(all_jobs) >= max_jobs:
+                print(f"\n✓ Reached maximum jobs limit ({max_jobs})")
+                break
+            
+            if not pending:
+                if page >= last_page:
+                    break
+                if page < planned_pages:
+                    to_page = min(planned_pages, page + self.max_workers)
+                else:
+                    # Skipped cards left the planned pages short of max_jobs
+                    extra_pages = math.ceil((max_jobs - len(all_jobs)) / page_size)
+                    to_page = min(last_page, page + min(extra_pages, self.max_workers))
+                    print("\nFetching more listing pages to make up for skipped jobs")
+                pending = self.fetch_listing_pages(base_url, page + 1, to_page)
+            
+            page += 1
+            cards = pending.pop(0)
+            
+            print(f"\n{'='*60}")
+            print(f"Scraping Page {page}")
+            print(f"{'='*60}")
+            
+            jobs_remaining = None
+            if max_jobs:
+                jobs_remaining = max_jobs - len(all_jobs)
+                print(f"Jobs remaining to scrape: {jobs_remaining}")
+            
+            jobs = self.scrape_job_cards(cards, max_jobs_this_page=jobs_remaining)
+            if not jobs:
+                print(f"No jobs found on page {page}.")
+            else:
+                all_jobs.extend(jobs)
+                print(f"\nTotal jobs scraped so far: {len(all_jobs)}")
+        
+        self.print_field_sources()
+        return all_jobs
+    
+    def fetch_listing_pages(self, base_url, first_page, last_page):
+        """Fetch the job cards of a range of listing pages concurrently
+        
+        Returns:
+            List of card lists, one per page from first_page to last_page
+        """
+        urls = [self.page_url(base_url, page) for page in range(first_page, last_page + 1)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return [cards for soup, cards in executor.map(self.fetch_listing_cards, urls)]
+    
+    def scrape_pages_sequentially(self, base_url, max_pages=None, max_jobs=None):
+        """Scrape pages one by one until two consecutive pages come back empty
+        
         Args:
             base_url: Starting URL
             max_pages: Maximum number of pages to scrape (None for unlimited)
@@ -38,11 +197,7 @@ class ComputrabajoScraper:
                 print(f"\n✓ Reached maximum jobs limit ({max_jobs})")
                 break
             
-            if page == 1:
-                url = base_url
-            else:
-                separator = '&' if '?' in base_url else '?'
-                url = f"{base_url.split('#')[0]}{separator}p={page}"
+            url = self.page_url(base_url, page)
             
             print(f"\n{'='*60}")
             print(f"Scraping Page {page}")
@@ -75,8 +230,66 @@ class ComputrabajoScraper:
             page += 1
             time.sleep(2)
         
+        self.print_field_sources()
         return all_jobs
     
+    def page_url(self, base_url, page):
+        """Build the URL of a listing page"""
+        if page == 1:
+            return base_url
+        separator = '&' if '?' in base_url else '?'
+        return f"{base_url.split('#')[0]}{separator}p={page}"
+    
+    def get_total_offers(self, soup):
+        """Get the total number of offers announced on a listing page"""
+        h1 = soup.find('h1')
+        for container in ([h1.parent] if h1 and h1.parent else []) + [soup]:
+            match = re.search(r'(\d[\d.,]*)\s*ofertas', container.get_text(' '), re.I)
+            if match:
+                return int(re.sub(r'[.,]', '', match.group(1)))
+        return None
+    
+    def get_last_page(self, soup):
+        """Get the highest page number linked from the pagination"""
+        pages = []
+        for tag in soup.find_all(['a', 'span', 'li']):
+            for attr in ('href', 'data-path'):
+                match = re.search(r'[?&]p=(\d+)', tag.get(attr) or '')
+                if match:
+                    pages.append(int(match.group(1)))
+        return max(pages) if pages else None
+    
+    def get_page_count(self, soup, page_size):
+        """Work out how many listing pages there are from the first one"""
+        if not page_size:
+            return None
+        total = self.get_total_offers(soup)
+        if total:
+            return math.ceil(total / page_size)
+        return self.get_last_page(soup)
+    
+    def fetch(self, url):
+        """GET a page through the shared session, respecting the rate limit"""
+        self.rate_limiter.wait()
+        response = self.session.get(url, headers=self.headers, timeout=30)
+        response.encoding = 'utf-8'
+        return response
+    
+    def parse_page(self, content, region, required):
+        """Parse the region of interest of a page
+        
+        Args:
+            content: Raw page content
+            region: SoupStrainer selecting the tags to build (None for the full page)
+            required: Tag name the scoped tree must contain, otherwise the
+                full page is parsed instead
+        """
+        if self.scoped_parsing and region is not None:
+            soup = BeautifulSoup(content, 'html.parser', parse_only=region)
+            if soup.find(required):
+                return soup
+        return BeautifulSoup(content, 'html.parser')
+    
     def has_next_page(self, url):
         """Check if there's a next page available"""
         return True
@@ -88,14 +301,26 @@ class ComputrabajoScraper:
             url: Page URL to scrape
             max_jobs_this_page: Maximum jobs to scrape from this page (None for all)
         """
+        soup, job_cards = self.fetch_listing_cards(url)
+        return self.scrape_job_cards(job_cards, max_jobs_this_page)
+    
+    def fetch_listing_cards(self, url, full_page=False):
+        """Fetch a listing page and find its job cards
+        
+        Args:
+            url: Page URL to fetch
+            full_page: Parse the whole page rather than only the job cards
+        
+        Returns:
+            Tuple of (soup, job cards); (None, []) if the page could not be fetched
+        """
         print(f"Fetching: {url}")
         try:
-            response = self.session.get(url, headers=self.headers, timeout=30)
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            jobs = []
-            job_cards = []
+            response = self.fetch(url)
+            if self.archive:
+                self.archive.add(url, response.content, 'listing')
+            region = None if full_page else LISTING_REGION
+            soup = self.parse_page(response.content, region, 'article')
             
             job_cards = soup.find_all('article')
             
@@ -107,38 +332,48 @@ class ComputrabajoScraper:
                 job_cards = [link.find_parent(['article', 'div']) for link in all_links if link.find_parent(['article', 'div'])]
                 job_cards = list({id(card): card for card in job_cards if card}.values())
             
-            # Limit job cards if max specified
-            if max_jobs_this_page:
-                job_cards = job_cards[:max_jobs_this_page]
-            
-            print(f"Found {len(job_cards)} job cards on listing page")
+            return soup, job_cards
+        except Exception as e:
+            print(f"Error fetching job listings: {e}")
+            return None, []
+    
+    def scrape_job_cards(self, job_cards, max_jobs_this_page=None):
+        """Scrape the detail pages of the given job cards
+        
+        Args:
+            job_cards: Job cards found on a listing page
+            max_jobs_this_page: Maximum jobs to scrape from these cards (None for all)
+        """
+        print(f"Found {len(job_cards)} job cards on listing page")
+        
+        jobs = []
+        successful = 0
+        skipped = 0
+        
+        for idx, card in enumerate(job_cards, 1):
+            # Stop once enough jobs were scraped; skipped cards do not count
+            if max_jobs_this_page and successful >= max_jobs_this_page:
+                break
             
-            successful = 0
-            skipped = 0
+            job_url = self.get_job_url(card)
             
-            for idx, card in enumerate(job_cards, 1):
-                job_url = self.get_job_url(card)
-                
-                if job_url:
-                    print(f"\nProcessing job {idx}/{len(job_cards)}...")
-                    try:
-                        job_data = self.scrape_job_details(job_url, card)
-                        jobs.append(job_data)
-                        successful += 1
-                        time.sleep(1)
-                    except Exception as e:
-                        print(f"Error scraping job {idx}: {e}")
-                        skipped += 1
-                        continue
-                else:
-                    print(f"\nSkipping job {idx}/{len(job_cards)} - No URL found")
+            if job_url:
+                print(f"\nProcessing job {idx}/{len(job_cards)}...")
+                try:
+                    job_data = self.scrape_job_details(job_url, card)
+                    jobs.append(job_data)
+                    successful += 1
+                    time.sleep(1)
+                except Exception as e:
+                    print(f"Error scraping job {idx}: {e}")
                     skipped += 1
-            
-            print(f"\nSummary: {successful} successful, {skipped} skipped")
-            return jobs
-        except Exception as e:
-            print(f"Error fetching job listings: {e}")
-            return []
+                    continue
+            else:
+                print(f"\nSkipping job {idx}/{len(job_cards)} - No URL found")
+                skipped += 1
+        
+        print(f"\nSummary: {successful} successful, {skipped} skipped")
+        return jobs
     
     def get_job_url(self, card):
         """Extract job detail URL from card"""
@@ -164,45 +399,246 @@ class ComputrabajoScraper:
         
         return None
     
-    def scrape_job_details(self, job_url, card):
+    def scrape_job_details(self, job_url, card, fetched_at=None):
         """Scrape detailed information from individual job page"""
         print(f"Fetching details from: {job_url}")
         
-        response = self.session.get(job_url, headers=self.headers, timeout=30)
-        response.encoding = 'utf-8'
-        detail_soup = BeautifulSoup(response.content, 'html.parser')
-        
-        job = {
-            '_job_featured_image': self.get_featured_image(detail_soup),
-            '_job_title': self.get_title(detail_soup, card),
-            '_job_featured': '1' if self.is_featured(card) else '0',
-            '_job_filled': '1' if self.is_filled(detail_soup) else '0',
-            '_job_urgent': '1' if self.is_urgent(card) else '0',
-            '_job_description': self.get_description(detail_soup),
-            '_job_category': self.get_category(detail_soup),
-            '_job_type': self.get_type(detail_soup),
-            '_job_tag': 'Costa Rica',
-            '_job_expiry_date': default_deadline,
-            '_job_gender': self.get_gender(detail_soup),
-            '_job_apply_type': 'external',
-            '_job_apply_url': job_url,
-            '_job_apply_email': self.get_apply_email(detail_soup),
-            '_job_salary_type': self.get_salary_type(detail_soup),
-            '_job_salary': self.get_salary(detail_soup, card),
-            '_job_max_salary': self.get_max_salary(detail_soup, card),
-            '_job_experience': self.get_experience(detail_soup),
-            '_job_career_level': self.get_career_level(detail_soup),
-            '_job_qualification': self.get_qualification(detail_soup),
-            '_job_video_url': self.get_video_url(detail_soup),
-            '_job_photos': ','.join(self.get_photos(detail_soup)),
-            '_job_application_deadline_date': default_deadline,
-            '_job_address': self.get_address(detail_soup,card),
-            '_job_location': self.get_location(detail_soup, card),
-            '_job_map_location': self.get_map_location(detail_soup,card),
+        response = self.fetch(job_url)
+        if self.archive:
+            self.archive.add(job_url, response.content, 'detail', card=card)
+        return self.extract_job_details(job_url, response.content, card, fetched_at)
+    
+    def check_offer(self, job_url, fetched_at=None):
+        """Re-fetch an offer to see whether it has closed
+        
+        An offer is closed when its page is gone (404/410), redirects out of
+        the offers section, or says the position is filled. Any other error
+        response raises requests.HTTPError.
+        
+        Returns:
+            Tuple of (closed, job). `job` is the re-extracted offer without
+            its listing card fields, or None when the page is gone
+        """
+        response = self.fetch(job_url)
+        if response.status_code in (404, 410) or '/ofertas-de-trabajo/' not in response.url:
+            return True, None
+        response.raise_for_status()
+        if self.archive:
+            self.archive.add(job_url, response.content, 'detail')
+        job = self.extract_job_details(job_url, response.content, BeautifulSoup('', 'html.parser'), fetched_at)
+        return job['_job_filled'] == '1', job
+    
+    def is_offer_closed(self, job):
+        """Confirm that an offer missing from this run has closed (False on errors)"""
+        try:
+            return self.check_offer(job['_job_apply_url'])[0]
+        except Exception as e:
+            print(f"Error rechecking {job['_job_apply_url']}: {e}")
+            return False
+    
+    def extract_job_details(self, job_url, content, card, fetched_at=None):
+        """Extract a job from the content of its detail page
+        
+        Args:
+            job_url: URL of the detail page
+            content: Raw detail page content
+            card: Job card from the listing page
+            fetched_at: When the page was fetched (defaults to now); the
+                placeholder deadline is counted from it
+        """
+        default_deadline = default_deadline_on(fetched_at or datetime.now())
+        self.default_deadlines.add(default_deadline)
+        detail_soup = self.parse_page(content, DETAIL_REGION, 'h1')
+        
+        structured = self.get_structured_data(detail_soup, content)
+        extractors = {
+            '_job_featured_image': lambda: self.get_featured_image(detail_soup),
+            '_job_title': lambda: self.get_title(detail_soup, card),
+            '_job_featured': lambda: '1' if self.is_featured(card) else '0',
+            '_job_filled': lambda: '1' if self.is_filled(detail_soup) else '0',
+            '_job_urgent': lambda: '1' if self.is_urgent(card) else '0',
+            '_job_description': lambda: self.get_description(detail_soup),
+            '_job_category': lambda: self.get_category(detail_soup),
+            '_job_type': lambda: self.get_type(detail_soup),
+            '_job_tag': lambda: 'Costa Rica',
+            '_job_expiry_date': lambda: default_deadline,
+            '_job_gender': lambda: self.get_gender(detail_soup),
+            '_job_apply_type': lambda: 'external',
+            '_job_apply_url': lambda: job_url,
+            '_job_apply_email': lambda: self.get_apply_email(detail_soup),
+            '_job_salary_type': lambda: self.get_salary_type(detail_soup),
+            '_job_salary': lambda: self.get_salary(detail_soup, card),
+            '_job_max_salary': lambda: self.get_max_salary(detail_soup, card),
+            '_job_experience': lambda: self.get_experience(detail_soup),
+            '_job_career_level': lambda: self.get_career_level(detail_soup),
+            '_job_qualification': lambda: self.get_qualification(detail_soup),
+            '_job_video_url': lambda: self.get_video_url(detail_soup),
+            '_job_photos': lambda: ','.join(self.get_photos(detail_soup)),
+            '_job_application_deadline_date': lambda: default_deadline,
+            '_job_address': lambda: self.get_address(detail_soup, card),
+            '_job_location': lambda: self.get_location(detail_soup, card),
+            '_job_map_location': lambda: self.get_map_location(detail_soup, card),
         }
         
+        # Structured data wins; the heuristic extractors only run for
+        # fields it did not provide
+        job = {}
+        for field, extract in extractors.items():
+            if structured.get(field):
+                job[field] = structured[field]
+                self.field_sources[field, 'structured'] += 1
+            else:
+                job[field] = extract()
+                if field not in UNEXTRACTED_FIELDS:
+                    self.field_sources[field, 'heuristic'] += 1
+        
+        if self.compact_records:
+            return JobRecord.from_dict(job)
         return job
     
+    def get_structured_data(self, soup, content):
+        """Read `_job_*` fields from the page's JSON-LD JobPosting and og: meta tags"""
+        fields = {}
+        posting = self.get_job_posting(content)
+        
+        if posting:
+            fields['_job_title'] = self._ld_text(posting.get('title'))
+            
+            description = posting.get('description')
+            if isinstance(description, str) and description.strip():
+                text = BeautifulSoup(description, 'html.parser').get_text('\n', strip=True)
+                fields['_job_description'] = '\n\n'.join(line for line in text.splitlines() if line.strip())
+            
+            fields['_job_category'] = self._ld_text(posting.get('occupationalCategory') or posting.get('industry'))
+            
+            employment_types = posting.get('employmentType')
+            if isinstance(employment_types, str):
+                employment_types = [employment_types]
+            if isinstance(employment_types, list):
+                fields['_job_type'] = ', '.join(
+                    EMPLOYMENT_TYPES.get(t, t) for t in employment_types if isinstance(t, str)
+                )
+            
+            valid_through = self._ld_text(posting.get('validThrough'))[:10]
+            if re.match(r'\d{4}-\d{2}-\d{2}$', valid_through):
+                fields['_job_expiry_date'] = valid_through
+                fields['_job_application_deadline_date'] = valid_through
+            
+            organization = posting.get('hiringOrganization')
+            if isinstance(organization, dict):
+                logo = organization.get('logo')
+                fields['_job_featured_image'] = self._ld_text(logo.get('url') if isinstance(logo, dict) else logo)
+            
+            fields.update(self._ld_salary(posting.get('baseSalary')))
+            
+            experience = posting.get('experienceRequirements')
+            if isinstance(experience, dict):
+                months = experience.get('monthsOfExperience')
+                if isinstance(months, (int, float)) or (isinstance(months, str) and months.isdigit()):
+                    years = int(months) // 12
+                    if years:
+                        fields['_job_experience'] = f"{years} {'año' if years == 1 else 'años'} de experiencia"
+                    else:
+                        fields['_job_experience'] = 'Menos de 1 año de experiencia'
+            else:
+                fields['_job_experience'] = self._ld_text(experience)
+            
+            education = posting.get('educationRequirements')
+            if isinstance(education, dict):
+                education = education.get('credentialCategory')
+            education = self._ld_text(education)
+            if education:
+                fields['_job_qualification'] = f"Educación mínima: {education}"
+            
+            locations = posting.get('jobLocation')
+            if isinstance(locations, dict):
+                locations = [locations]
+            if isinstance(locations, list) and locations and isinstance(locations[0], dict):
+                address = locations[0].get('address')
+                if isinstance(address, dict):
+                    city = self._ld_text(address.get('addressLocality') or address.get('addressRegion'))
+                    fields['_job_address'] = city
+                    fields['_job_location'] = city
+                    fields['_job_map_location'] = city
+        
+        if not fields.get('_job_featured_image'):
+            og_image = soup.find('meta', property='og:image')
+            if og_image:
+                fields['_job_featured_image'] = og_image.get('content', '')
+        
+        return {field: value for field, value in fields.items() if value}
+    
+    def get_job_posting(self, content):
+        """Get the JobPosting object from the JSON-LD scripts of the raw page"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        for block in LD_JSON_RE.findall(content):
+            try:
+                data = json.loads(block)
+            except ValueError:
+                continue
+            
+            candidates = data if isinstance(data, list) else [data]
+            for item in list(candidates):
+                if isinstance(item, dict) and isinstance(item.get('@graph'), list):
+                    candidates.extend(item['@graph'])
+            
+            for item in candidates:
+                if not isinstance(item, dict):
+                    continue
+                item_type = item.get('@type')
+                if item_type == 'JobPosting' or (isinstance(item_type, list) and 'JobPosting' in item_type):
+                    return item
+        return None
+    
+    def _ld_text(self, value):
+        """Return a JSON-LD value as a stripped string ('' if not a string)"""
+        if isinstance(value, list):
+            value = value[0] if value else ''
+        if isinstance(value, dict):
+            value = value.get('name', '')
+        return value.strip() if isinstance(value, str) else ''
+    
+    def _ld_salary(self, base_salary):
+        """Map a JSON-LD MonetaryAmount onto the salary fields"""
+        if not isinstance(base_salary, dict):
+            return {}
+        value = base_salary.get('value')
+        if not isinstance(value, dict):
+            value = {'value': value}
+        
+        amounts = []
+        for key in ('minValue', 'value', 'maxValue'):
+            try:
+                amounts.append(float(value.get(key)))
+            except (TypeError, ValueError):
+                continue
+        if not amounts:
+            return {}
+        
+        def format_amount(amount):
+            # Same format as the page text, e.g. "500 000,00 ₡"
+            text = f"{amount:,.2f}".replace(',', '\u00a0').replace('.', ',')
+            return f"{text} ₡" if base_salary.get('currency', 'CRC') == 'CRC' else f"{text} {base_salary['currency']}"
+        
+        fields = {
+            '_job_salary': format_amount(min(amounts)),
+            '_job_max_salary': format_amount(max(amounts)),
+        }
+        unit = str(value.get('unitText', '')).upper()
+        if unit in SALARY_UNITS:
+            fields['_job_salary_type'] = SALARY_UNITS[unit]
+        return fields
+    
+    def print_field_sources(self):
+        """Print how many times each field came from structured data vs heuristics"""
+        print("\nField sources (structured / heuristic):")
+        fields = dict.fromkeys(field for field, source in self.field_sources)
+        for field in fields:
+            structured = self.field_sources[field, 'structured']
+            heuristic = self.field_sources[field, 'heuristic']
+            print(f"  {field}: {structured} / {heuristic}")
+    
     def get_featured_image(self, soup):
         """Get company logo or featured image"""
         img = soup.find('img', class_=re.compile('logo|company'))
@@ -378,6 +814,27 @@ class ComputrabajoScraper:
         updated = soup.find(string=re.compile(r'Hace.*actualizada', re.I))
         return updated.strip() if updated else ''
     
+    def get_posting_age(self, soup):
+        """Get how long ago an offer was published or updated
+        
+        Reads relative dates such as "Hace 3 días" or "Hace una hora
+        (actualizada)" from a detail page or listing card.
+        
+        Returns:
+            timedelta, or None if no relative date was found
+        """
+        text = soup.find(string=POSTING_AGE_RE)
+        if not text:
+            return None
+        match = POSTING_AGE_RE.search(text)
+        amount = match.group(1).lower()
+        amount = 1 if amount in ('un', 'una') else int(amount)
+        unit = match.group(2).lower()
+        for prefix, delta in POSTING_AGE_UNITS.items():
+            if unit.startswith(prefix):
+                return amount * delta
+        return None
+    
     def get_gender(self, soup):
         """Get gender requirements"""
         gender = soup.find(string=re.compile('Hombres|Mujeres|Indistinto', re.I))
@@ -499,7 +956,7 @@ class ComputrabajoScraper:
     def save_to_json(self, jobs, filename='jobs_computrabajo.json'):
         """Save scraped data to JSON file"""
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
+            json.dump(jobs, f, ensure_ascii=False, indent=2, default=to_json_default)
         print(f"\n✓ Saved {len(jobs)} jobs to {filename}")
     
     def save_to_csv(self, jobs, filename='jobs_computrabajo.csv'):
@@ -537,9 +994,43 @@ class ComputrabajoScraper:
             
             print(f"✓ Saved {len(jobs)} jobs to {filename}")
 
+    def save_to_sqlite(self, jobs, filename='jobs_computrabajo.db'):
+        """Upsert scraped data into a SQLite database keyed by offer ID
+        
+        New or changed jobs are also added to the full-text search index.
+        """
+        with SQLiteJobStore(filename) as store:
+            changed = store.upsert_jobs(jobs, default_deadlines=self.default_deadlines)
+        with JobSearchIndex(filename) as index:
+            index.update(changed)
+        print(f"✓ Saved {len(jobs)} jobs to {filename} ({len(changed)} new or changed)")
+        return changed
+
+    def save_delta(self, jobs, baseline_file='jobs_delta_baseline.json', prefix='jobs_delta'):
+        """Save new, changed and closed offers since the previous run
+        
+        Offers missing from this run are rechecked and only reported closed
+        once confirmed, since a capped or partly failed run does not list
+        every open offer. Unconfirmed ones stay in the baseline.
+        """
+        added, updated, closed = export_delta(
+            jobs, baseline_file, prefix, default_deadlines=self.default_deadlines, is_closed=self.is_offer_closed
+        )
+        print(f"✓ Saved delta to {prefix}_*.json ({len(added)} added, {len(updated)} updated, {len(closed)} closed)")
+        return added, updated, closed
+
 # Usage
 if __name__ == "__main__":
-    scraper = ComputrabajoScraper()
+    parser = argparse.ArgumentParser(description="Scrape job offers from Computrabajo")
+    parser.add_argument('--archive', nargs='?', const='pages_archive.gz', default=None,
+                        help="Archive fetched pages to this file (default: pages_archive.gz)")
+    args = parser.parse_args()
+    
+    archive = None
+    if args.archive:
+        from archive import PageArchive
+        archive = PageArchive(args.archive)
+    scraper = ComputrabajoScraper(archive=archive)
     base_url = "https://cr.computrabajo.com/empleos-en-san-jose"
     
     print("=" * 60)
@@ -558,8 +1049,10 @@ if __name__ == "__main__":
     print("=" * 60)
     
     if jobs:
+        scraper.save_delta(jobs)
         scraper.save_to_json(jobs)
         scraper.save_to_csv(jobs)
+        scraper.save_to_sqlite(jobs)
         
         print("\n" + "=" * 60)
         print("Sample Job Data (First Job):")
@@ -570,6 +1063,11 @@ if __name__ == "__main__":
         print("Files created:")
         print("  - jobs_computrabajo.json")
         print("  - jobs_computrabajo.csv")
+        print("  - jobs_computrabajo.db")
+        print("  - jobs_delta_added.json, jobs_delta_updated.json, jobs_delta_closed.json")
+        print("  - jobs_delta_baseline.json")
+        if archive:
+            print(f"  - {archive.filename} (+ .idx)")
         print("=" * 60)
     else:
         print("\n⚠ No jobs found. Please check the URL or HTML structure.")
\ No newline at end of file
@@ -0,0 +1,183 @@
+import re
+import sqlite3
+
+from fields import fold, parse_salary, province_of
+from job_record import JOB_FIELDS, offer_id
+
+TOKEN_RE = re.compile(r'\w+')
+
+STOPWORDS = frozenset((
+    'a', 'al', 'con', 'de', 'del', 'el', 'en', 'la', 'las', 'lo', 'los',
+    'o', 'para', 'por', 'se', 'su', 'sus', 'un', 'una', 'y',
+))
+
+
+def stem(word):
+    """Light Spanish stemmer that merges plural and gender variants
+
+    `vendedores`, `vendedora` and `vendedor` all become `vendedor`.
+    """
+    if len(word) > 3 and word.endswith('s'):
+        word = word[:-1]
+    if len(word) > 4 and word[-1] in 'aeo':
+        word = word[:-1]
+    return word
+
+
+def tokenize(text):
+    """Split text into accent-insensitive, stemmed search terms"""
+    return [stem(token) for token in TOKEN_RE.findall(fold(text)) if token not in STOPWORDS]
+
+
+class JobSearchIndex:
+    """Full-text and filter index over the jobs in a SQLiteJobStore database
+
+    Titles and descriptions go through `tokenize` before being stored in an
+    FTS5 table, so queries are accent-insensitive and match plural/gender
+    variants. Location, province, type, category and parsed salary are kept
+    in an indexed side table. Call `update` with new or changed jobs to keep the
+    index current without rebuilding it.
+    """
+
+    def __init__(self, filename='jobs_computrabajo.db', timeout=30):
+        self.filename = filename
+        self.conn = sqlite3.connect(filename, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def create_schema(self):
+        """Create the search tables and indexes if missing"""
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS job_search (offer_id TEXT UNIQUE NOT NULL, '
+            'location_key TEXT, province_key TEXT, type_key TEXT, category_key TEXT, '
+            'salary_min INTEGER, salary_max INTEGER)'
+        )
+        self.conn.execute(
+            'CREATE VIRTUAL TABLE IF NOT EXISTS job_text USING fts5(title, description)'
+        )
+
+        for column in ('location_key', 'province_key', 'type_key', 'category_key', 'salary_min', 'salary_max'):
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_job_search_{column} ON job_search ({column})')
+
+    def update(self, jobs):
+        """Add or refresh jobs in the index
+
+        Args:
+            jobs: Iterable of job dicts or JobRecord objects
+        """
+        count = 0
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            for job in jobs:
+                self._index_job(job)
+                count += 1
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        return count
+
+    def _index_job(self, job):
+        oid = offer_id(job)
+        salary_min, salary_max = parse_salary(job.get('_job_salary', ''))
+        facets = (
+            fold(job.get('_job_location', '')),
+            fold(province_of(job.get('_job_location', ''), job.get('_job_address', ''))),
+            fold(job.get('_job_type', '')),
+            fold(job.get('_job_category', '')),
+            salary_min,
+            salary_max,
+        )
+        text = (
+            ' '.join(tokenize(job.get('_job_title', ''))),
+            ' '.join(tokenize(job.get('_job_description', ''))),
+        )
+
+        row = self.conn.execute('SELECT rowid FROM job_search WHERE offer_id = ?', (oid,)).fetchone()
+        if row:
+            rowid = row[0]
+            self.conn.execute(
+                'UPDATE job_search SET location_key = ?, province_key = ?, type_key = ?, category_key = ?, '
+                'salary_min = ?, salary_max = ? WHERE rowid = ?',
+                facets + (rowid,),
+            )
+            self.conn.execute('DELETE FROM job_text WHERE rowid = ?', (rowid,))
+        else:
+            rowid = self.conn.execute(
+                'INSERT INTO job_search (offer_id, location_key, province_key, type_key, category_key, '
+                'salary_min, salary_max) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (oid,) + facets,
+            ).lastrowid
+        self.conn.execute('INSERT INTO job_text (rowid, title, description) VALUES (?, ?, ?)', (rowid,) + text)
+
+    def rebuild(self):
+        """Index every job currently in the jobs table"""
+        self.conn.execute('DELETE FROM job_search')
+        self.conn.execute('DELETE FROM job_text')
+        columns = ', '.join(JOB_FIELDS)
+        jobs = [dict(row) for row in self.conn.execute(f'SELECT {columns} FROM jobs')]
+        return self.update(jobs)
+
+    def search(self, text='', location=None, job_type=None, category=None,
+               min_salary=None, max_salary=None, limit=50):
+        """Search indexed jobs
+
+        Args:
+            text: Words that must all appear in the title or description
+            location: Canton or province, matched accent/case-insensitively;
+                a province also matches every canton in it
+            job_type: Employment type, matched accent/case-insensitively
+            category: Category, matched accent/case-insensitively
+            min_salary: Only jobs whose maximum parsed salary is at least this
+            max_salary: Only jobs whose minimum parsed salary is at most this
+            limit: Maximum number of results
+
+        Returns:
+            List of job dicts, best text matches first
+        """
+        clauses = []
+        params = []
+        columns = ', '.join(f'j.{field}' for field in JOB_FIELDS)
+
+        terms = tokenize(text)
+        if terms:
+            sql = (
+                f'SELECT {columns} FROM job_text t JOIN job_search s ON s.rowid = t.rowid '
+                'JOIN jobs j ON j.offer_id = s.offer_id'
+            )
+            clauses.append('job_text MATCH ?')
+            params.append(' '.join(f'"{term}"' for term in terms))
+        else:
+            sql = f'SELECT {columns} FROM job_search s JOIN jobs j ON j.offer_id = s.offer_id'
+
+        if location is not None:
+            clauses.append('(s.location_key = ? OR s.province_key = ?)')
+            params.extend([fold(location), fold(location)])
+        for column, value in (('type_key', job_type), ('category_key', category)):
+            if value is not None:
+                clauses.append(f's.{column} = ?')
+                params.append(fold(value))
+        if min_salary is not None:
+            clauses.append('s.salary_max >= ?')
+            params.append(min_salary)
+        if max_salary is not None:
+            clauses.append('s.salary_min <= ?')
+            params.append(max_salary)
+
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        if terms:
+            sql += ' ORDER BY t.rank'
+        sql += ' LIMIT ?'
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(sql, params)]
@@ -0,0 +1,158 @@
+import sqlite3
+from datetime import datetime
+
+from job_record import JOB_FIELDS, content_hash, offer_id
+
+INDEXED_COLUMNS = ('_job_location', '_job_category', '_job_type', 'first_seen', 'last_seen')
+
+
+class SQLiteJobStore:
+    """SQLite storage for scraped jobs, keyed by Computrabajo offer ID
+
+    Jobs are upserted in batched transactions. A record whose content hash
+    is unchanged only has its `last_seen` bumped, so the cost of a run scales
+    with the number of new or changed offers. The database runs in WAL mode
+    and waits on locks, so several scrapes can write to it at once.
+    """
+
+    def __init__(self, filename='jobs_computrabajo.db', batch_size=500, timeout=30):
+        """
+        Args:
+            filename: SQLite database file
+            batch_size: Number of jobs written per transaction
+            timeout: Seconds to wait for another writer to release the lock
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(filename, timeout=timeout, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def create_schema(self):
+        """Create the jobs table and its indexes if missing"""
+        columns = ''.join(f'{field} TEXT, ' for field in JOB_FIELDS)
+        self.conn.execute(
+            f'CREATE TABLE IF NOT EXISTS jobs (offer_id TEXT PRIMARY KEY, {columns}'
+            'content_hash TEXT NOT NULL, first_seen TEXT NOT NULL, last_seen TEXT NOT NULL)'
+        )
+        for column in INDEXED_COLUMNS:
+            name = column.replace('_job_', '')
+            self.conn.execute(f'CREATE INDEX IF NOT EXISTS idx_jobs_{name} ON jobs ({column})')
+
+    def upsert_jobs(self, jobs, seen_at=None, default_deadlines=()):
+        """Insert new jobs and update changed ones
+
+        Args:
+            jobs: Iterable of job dicts or JobRecord objects
+            seen_at: Timestamp recorded as last_seen (defaults to now)
+            default_deadlines: Placeholder deadlines the jobs were scraped
+                with; a deadline equal to one is not compared as content
+
+        Returns:
+            List of the jobs that were inserted or whose content changed
+        """
+        seen_at = seen_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        changed = []
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if len(batch) >= self.batch_size:
+                changed.extend(self._upsert_batch(batch, seen_at, default_deadlines))
+                batch = []
+        if batch:
+            changed.extend(self._upsert_batch(batch, seen_at, default_deadlines))
+        return changed
+
+    def _upsert_batch(self, jobs, seen_at, default_deadlines):
+        # Deduplicate within the batch, keeping the last copy of each offer
+        by_id = {offer_id(job): job for job in jobs}
+        hashes = {oid: content_hash(job, default_deadlines) for oid, job in by_id.items()}
+        placeholders = ','.join('?' * len(by_id))
+
+        columns = ('offer_id',) + JOB_FIELDS + ('content_hash', 'first_seen', 'last_seen')
+        updates = ', '.join(
+            f'{column} = excluded.{column}' for column in JOB_FIELDS + ('content_hash', 'last_seen')
+        )
+        upsert_sql = (
+            f"INSERT INTO jobs ({', '.join(columns)}) VALUES ({','.join('?' * len(columns))}) "
+            f"ON CONFLICT(offer_id) DO UPDATE SET {updates}"
+        )
+
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            stored = dict(self.conn.execute(
+                f'SELECT offer_id, content_hash FROM jobs WHERE offer_id IN ({placeholders})',
+                list(by_id),
+            ).fetchall())
+
+            changed_ids = [oid for oid in by_id if stored.get(oid) != hashes[oid]]
+            unchanged_ids = [oid for oid in by_id if stored.get(oid) == hashes[oid]]
+
+            self.conn.executemany(upsert_sql, [
+                (oid,) + tuple(str(by_id[oid].get(field, '')) for field in JOB_FIELDS)
+                + (hashes[oid], seen_at, seen_at)
+                for oid in changed_ids
+            ])
+            if unchanged_ids:
+                self.conn.execute(
+                    f"UPDATE jobs SET last_seen = ? WHERE offer_id IN ({','.join('?' * len(unchanged_ids))})",
+                    [seen_at] + unchanged_ids,
+                )
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        return [by_id[oid] for oid in changed_ids]
+
+    def get_job(self, oid):
+        """Get a stored job dict by offer ID, or None"""
+        row = self.conn.execute('SELECT * FROM jobs WHERE offer_id = ?', (oid,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def find_jobs(self, location=None, category=None, job_type=None, seen_since=None):
+        """Query stored jobs using the indexed columns
+
+        Args:
+            location: Exact `_job_location` value
+            category: Exact `_job_category` value
+            job_type: Exact `_job_type` value
+            seen_since: Only jobs with last_seen at or after this timestamp
+        """
+        clauses = []
+        params = []
+        for column, value in (('_job_location', location), ('_job_category', category), ('_job_type', job_type)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(value)
+        if seen_since is not None:
+            clauses.append('last_seen >= ?')
+            params.append(seen_since)
+
+        sql = 'SELECT * FROM jobs'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        return [self._row_to_job(row) for row in self.conn.execute(sql, params)]
+
+    def get_open_jobs(self):
+        """Get stored jobs not marked as filled
+
+        Returns:
+            List of (job dict, first_seen) tuples
+        """
+        rows = self.conn.execute("SELECT * FROM jobs WHERE _job_filled != '1'")
+        return [(self._row_to_job(row), row['first_seen']) for row in rows]
+
+    def _row_to_job(self, row):
+        return {field: row[field] for field in JOB_FIELDS}
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import requests
+
+# The modules live at the repository root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Placeholder deadlines of two consecutive scrape runs
+PLACEHOLDER = '2026-11-18'
+NEXT_PLACEHOLDER = '2026-11-19'
+
+
+def make_job(n, **fields):
+    """Build a job dict for offer number `n`, overriding any of its fields"""
+    job = {
+        '_job_apply_url': f'https://cr.computrabajo.com/ofertas-de-trabajo/oferta-{n}-{n:032X}',
+        '_job_title': f'Oferta {n}',
+        '_job_filled': '0',
+        '_job_location': 'San José',
+        '_job_expiry_date': PLACEHOLDER,
+        '_job_application_deadline_date': PLACEHOLDER,
+    }
+    job.update(fields)
+    return job
+
+
+class FakeResponse:
+    """Stand-in for requests.Response in stubbed `fetch` calls"""
+
+    def __init__(self, url, content=b'', status_code=200):
+        self.url = url
+        self.content = content.encode('utf-8') if isinstance(content, str) else content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
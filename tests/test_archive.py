@@ -0,0 +1,76 @@
+from datetime import datetime
+
+import pytest
+from bs4 import BeautifulSoup
+
+import archive as archive_module
+from archive import PageArchive, reextract
+from conftest import FakeResponse, make_job
+from job_record import default_deadline_on, offer_id
+from scraper import ComputrabajoScraper
+
+FETCHED_AT = datetime(2026, 9, 1, 8, 30)
+DETAIL_PAGE = '<html><body><main><h1>{title}</h1><p>Descripción de la oferta</p></main></body></html>'
+CARD = '<article><a href="{url}">Oferta</a><p>Escazú, San José</p><span>Urgente</span></article>'
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FETCHED_AT
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    monkeypatch.setattr(archive_module, 'datetime', FixedDatetime)
+    archive = PageArchive(str(tmp_path / 'pages.gz'))
+    yield archive
+    archive.close()
+
+
+def make_scraper(archive):
+    scraper = ComputrabajoScraper(requests_per_second=1000, archive=archive)
+    scraper.fetch = lambda url: FakeResponse(url, DETAIL_PAGE.format(title=f'Oferta {int(url[-32:], 16)}'))
+    return scraper
+
+
+def card_for(n):
+    return BeautifulSoup(CARD.format(url=make_job(n)['_job_apply_url']), 'html.parser').article
+
+
+def test_add_and_get(archive):
+    archive.add('https://cr.computrabajo.com/empleos?p=2', b'<html>listing</html>', 'listing')
+    archive.add(make_job(1)['_job_apply_url'], 'página'.encode('utf-8'), 'detail', card='<article/>')
+
+    header, content = archive.get(oid=offer_id(make_job(1)))
+    assert content == 'página'.encode('utf-8')
+    assert header['kind'] == 'detail' and header['card'] == '<article/>'
+    assert header['fetched_at'] == '2026-09-01 08:30:00'
+    assert archive.get(url='https://cr.computrabajo.com/empleos?p=2')[1] == b'<html>listing</html>'
+    assert archive.get(url='https://cr.computrabajo.com/missing') is None
+
+
+def test_recheck_is_archived_with_the_stored_card(archive):
+    scraper = make_scraper(archive)
+    url = make_job(1)['_job_apply_url']
+    scraper.scrape_job_details(url, card_for(1))
+
+    scraper.check_offer(url)
+
+    assert len(archive.latest_records('detail')) == 1
+    assert archive.index.execute('SELECT COUNT(*) FROM pages').fetchone()[0] == 2
+    assert archive.get(url=url)[0]['card'] == str(card_for(1))
+
+
+def test_reextract_matches_the_scraped_jobs(archive):
+    scraper = make_scraper(archive)
+    scraped = [
+        scraper.scrape_job_details(make_job(n)['_job_apply_url'], card_for(n), fetched_at=FETCHED_AT)
+        for n in (1, 2, 3)
+    ]
+
+    rebuilt = reextract(archive.filename, workers=1, chunk_size=2)
+
+    assert rebuilt == scraped
+    assert rebuilt[0]['_job_urgent'] == '1'
+    assert rebuilt[0]['_job_expiry_date'] == default_deadline_on(FETCHED_AT)
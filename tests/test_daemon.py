@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import pytest
+
+from conftest import FakeResponse, make_job
+from daemon import RecrawlScheduler
+from job_record import default_deadline_on, offer_id
+from scraper import ComputrabajoScraper
+
+DETAIL_PAGE = '<html><body><main><h1>{title}</h1><p>Descripción</p></main></body></html>'
+
+
+@pytest.fixture
+def scheduler(tmp_path):
+    scheduler = RecrawlScheduler(ComputrabajoScraper(requests_per_second=1000), 'https://cr.computrabajo.com/empleos',
+                                 db=str(tmp_path / 'jobs.db'))
+    job = make_job(1, _job_featured='1', _job_location='Escazú', _job_address='Escazú')
+    scheduler.save([job], datetime(2026, 10, 1))
+    scheduler.known[job['_job_apply_url']] = datetime.now()
+    return scheduler
+
+
+def stored(scheduler):
+    return scheduler.store.get_job(offer_id(make_job(1)))
+
+
+def serve(scheduler, status_code=200, title='Oferta 1'):
+    scheduler.scraper.fetch = lambda url: FakeResponse(url, DETAIL_PAGE.format(title=title), status_code)
+
+
+def test_recheck_keeps_card_fields(scheduler):
+    serve(scheduler, title='Oferta 1 (actualizada)')
+    scheduler.recheck_offer(make_job(1)['_job_apply_url'])
+
+    job = stored(scheduler)
+    assert job['_job_title'] == 'Oferta 1 (actualizada)'
+    assert job['_job_featured'] == '1'
+    assert job['_job_location'] == job['_job_address'] == 'Escazú'
+    assert scheduler.index.search(location='San Jose')
+
+
+def test_recheck_uses_current_placeholder_deadline(scheduler):
+    serve(scheduler)
+    scheduler.recheck_offer(make_job(1)['_job_apply_url'])
+    assert stored(scheduler)['_job_expiry_date'] == default_deadline_on(datetime.now())
+
+
+def test_error_response_leaves_stored_job_alone(scheduler):
+    serve(scheduler, status_code=503)
+    with pytest.raises(Exception):
+        scheduler.recheck_offer(make_job(1)['_job_apply_url'])
+    assert stored(scheduler)['_job_title'] == 'Oferta 1'
+
+
+def test_closed_offer_is_stored_filled_and_not_polled_again(scheduler):
+    url = make_job(1)['_job_apply_url']
+    serve(scheduler, status_code=404)
+    scheduler.recheck_offer(url)
+
+    assert stored(scheduler)['_job_filled'] == '1'
+    assert url not in scheduler.known
+    assert scheduler.is_closed(url)
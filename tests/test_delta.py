@@ -0,0 +1,120 @@
+import json
+import os
+
+from conftest import NEXT_PLACEHOLDER, PLACEHOLDER, make_job
+from delta import compute_delta, export_delta, load_baseline
+
+
+def next_run_job(n, **fields):
+    """Job as scraped by the next run, with that run's placeholder deadline"""
+    fields = dict({'_job_expiry_date': NEXT_PLACEHOLDER, '_job_application_deadline_date': NEXT_PLACEHOLDER}, **fields)
+    return make_job(n, **fields)
+
+
+def test_added_updated_closed():
+    previous = [make_job(1), make_job(2), make_job(3)]
+    current = [make_job(1), make_job(2, _job_title='Cajero'), make_job(4)]
+
+    added, updated, closed = compute_delta(previous, current)
+
+    assert added == [make_job(4)]
+    assert updated == [{'_job_apply_url': make_job(2)['_job_apply_url'], '_job_title': 'Cajero'}]
+    assert closed == [{'_job_apply_url': make_job(3)['_job_apply_url'], '_job_filled': '1'}]
+
+
+def test_already_filled_offer_is_not_closed_again():
+    previous = [make_job(1, _job_filled='1')]
+    assert compute_delta(previous, [])[2] == []
+
+
+def test_only_confirmed_closures_are_reported():
+    previous = [make_job(1), make_job(2)]
+    confirmed = {make_job(2)['_job_apply_url']}
+
+    closed = compute_delta(previous, [], is_closed=lambda job: job['_job_apply_url'] in confirmed)[2]
+
+    assert closed == [{'_job_apply_url': make_job(2)['_job_apply_url'], '_job_filled': '1'}]
+
+
+def test_moving_placeholder_deadline_is_not_an_update():
+    previous = [make_job(1)]
+    current = [next_run_job(1)]
+
+    updated = compute_delta(previous, current, (PLACEHOLDER,), (NEXT_PLACEHOLDER,))[1]
+
+    assert updated == []
+
+
+def test_real_deadline_change_is_an_update():
+    previous = [make_job(1, _job_expiry_date='2026-12-01')]
+    current = [next_run_job(1, _job_expiry_date='2026-12-15')]
+
+    updated = compute_delta(previous, current, (PLACEHOLDER,), (NEXT_PLACEHOLDER,))[1]
+
+    assert updated == [{'_job_apply_url': make_job(1)['_job_apply_url'], '_job_expiry_date': '2026-12-15'}]
+
+
+def run(tmp_path, jobs, default_deadlines=(NEXT_PLACEHOLDER,), is_closed=lambda job: False, seed_file=None):
+    return export_delta(jobs, str(tmp_path / 'baseline.json'), str(tmp_path / 'delta'), default_deadlines,
+                        is_closed, seed_file)
+
+
+def test_export_delta_writes_files(tmp_path):
+    run(tmp_path, [make_job(1), make_job(2)], default_deadlines=(PLACEHOLDER,))
+
+    added, updated, closed = run(tmp_path, [next_run_job(1), next_run_job(2), next_run_job(3)])
+
+    assert [job['_job_title'] for job in added] == ['Oferta 3']
+    assert updated == [] and closed == []
+    for name, records in (('added', added), ('updated', updated), ('closed', closed)):
+        with open(tmp_path / f'delta_{name}.json', encoding='utf-8') as f:
+            assert json.load(f) == records
+
+
+def test_baseline_records_placeholder_deadlines(tmp_path):
+    run(tmp_path, [make_job(1)], default_deadlines=(PLACEHOLDER,))
+    assert load_baseline(str(tmp_path / 'baseline.json')) == ([make_job(1)], (PLACEHOLDER,))
+
+
+def test_seed_export_without_placeholders(tmp_path):
+    # A plain jobs_computrabajo.json export, copied with a fresh mtime
+    seed_file = tmp_path / 'jobs_computrabajo.json'
+    previous = [make_job(n) for n in range(1, 51)] + [make_job(51, _job_expiry_date='2026-12-15')]
+    seed_file.write_text(json.dumps(previous), encoding='utf-8')
+
+    current = [next_run_job(n) for n in range(1, 51)]
+    added, updated, closed = run(tmp_path, current, seed_file=str(seed_file), is_closed=None)
+
+    assert added == [] and updated == []
+    assert closed == [{'_job_apply_url': make_job(51)['_job_apply_url'], '_job_filled': '1'}]
+
+
+def test_unconfirmed_missing_offers_stay_in_the_baseline(tmp_path):
+    url = make_job(3)['_job_apply_url']
+    run(tmp_path, [make_job(1), make_job(2), make_job(3)], default_deadlines=(PLACEHOLDER,))
+
+    # Offer 3 drops out of a capped run but is still open
+    assert run(tmp_path, [next_run_job(1), next_run_job(2)]) == ([], [], [])
+    jobs, deadlines = load_baseline(str(tmp_path / 'baseline.json'))
+    assert [job['_job_title'] for job in jobs] == ['Oferta 1', 'Oferta 2', 'Oferta 3']
+    assert deadlines == (PLACEHOLDER, NEXT_PLACEHOLDER)
+
+    # It is reported closed once a later run confirms it
+    closed = run(tmp_path, [next_run_job(1)], is_closed=lambda job: job['_job_apply_url'] == url)[2]
+    assert closed == [{'_job_apply_url': url, '_job_filled': '1'}]
+    jobs, deadlines = load_baseline(str(tmp_path / 'baseline.json'))
+    assert [job['_job_title'] for job in jobs] == ['Oferta 1', 'Oferta 2']
+
+
+def test_carried_offer_that_reappears_is_not_added(tmp_path):
+    run(tmp_path, [make_job(1), make_job(2)], default_deadlines=(PLACEHOLDER,))
+    run(tmp_path, [next_run_job(1)])
+
+    assert run(tmp_path, [next_run_job(1), next_run_job(2)]) == ([], [], [])
+
+
+def test_export_delta_without_baseline(tmp_path):
+    added, updated, closed = run(tmp_path, [next_run_job(1)])
+
+    assert added == [next_run_job(1)]
+    assert os.path.exists(tmp_path / 'delta_closed.json')
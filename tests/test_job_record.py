@@ -0,0 +1,59 @@
+import json
+import pickle
+
+import pytest
+
+from conftest import make_job
+from job_record import JOB_FIELDS, JobRecord, load_records, to_json_default
+from scraper import ComputrabajoScraper
+
+
+def full_job(n, **fields):
+    fields = dict({'_job_type': 'Tiempo Completo'}, **fields)
+    return dict(dict.fromkeys(JOB_FIELDS, ''), **make_job(n, **fields))
+
+
+def test_record_reads_like_the_dict():
+    job = full_job(1, _job_description='Atención al cliente')
+    record = JobRecord.from_dict(job)
+
+    assert dict(record) == job
+    assert record.to_dict() == job
+    assert list(record) == list(JOB_FIELDS)
+    assert record['_job_title'] == 'Oferta 1' and record.get('missing', 'x') == 'x'
+
+
+def test_record_is_read_only():
+    record = JobRecord.from_dict(full_job(1))
+    with pytest.raises(AttributeError):
+        record._job_title = 'Cajero'
+
+
+def test_low_cardinality_values_are_shared():
+    first = JobRecord.from_dict(full_job(1, _job_type=''.join(['Tiempo ', 'Completo'])))
+    second = JobRecord.from_dict(full_job(2, _job_type=''.join(['Tiempo ', 'Completo'])))
+    assert first['_job_type'] is second['_job_type']
+
+
+def test_pickle_round_trip():
+    record = JobRecord.from_dict(full_job(1))
+    restored = pickle.loads(pickle.dumps(record))
+
+    assert isinstance(restored, JobRecord)
+    assert restored.to_dict() == record.to_dict()
+
+
+def test_json_and_csv_match_dicts(tmp_path):
+    jobs = [full_job(1), full_job(2, _job_title='Cajero, "turno" noche')]
+    records = [JobRecord.from_dict(job) for job in jobs]
+    scraper = ComputrabajoScraper()
+
+    assert json.dumps(records, default=to_json_default) == json.dumps(jobs)
+
+    for name, data in (('dicts', jobs), ('records', records)):
+        scraper.save_to_json(data, str(tmp_path / f'{name}.json'))
+        scraper.save_to_csv(data, str(tmp_path / f'{name}.csv'))
+    for extension in ('json', 'csv'):
+        assert (tmp_path / f'dicts.{extension}').read_bytes() == (tmp_path / f'records.{extension}').read_bytes()
+
+    assert [record.to_dict() for record in load_records(str(tmp_path / 'records.json'))] == jobs
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from normalize import normalize_jobs
+
+
+def make_job(**fields):
+    job = {
+        '_job_title': 'Oferta',
+        '_job_salary': 'A convenir',
+        '_job_salary_type': '',
+        '_job_experience': '',
+        '_job_location': '',
+        '_job_address': '',
+        '_job_category': '',
+    }
+    job.update(fields)
+    return job
+
+
+def test_salary():
+    df = normalize_jobs([
+        make_job(_job_salary='310 000,00 ₡  + Comisiones', _job_salary_type='Mensual'),
+        make_job(_job_salary='1.200.000 - 1.500.000'),
+        make_job(),
+    ])
+
+    assert df['salary_min'].tolist()[:2] == [310000, 1200000]
+    assert df['salary_max'].tolist()[:2] == [310000, 1500000]
+    assert pd.isna(df['salary_min'][2]) and pd.isna(df['salary_max'][2])
+
+
+def test_experience():
+    df = normalize_jobs([
+        make_job(_job_experience='2 años de experiencia'),
+        make_job(_job_experience='Experiencia mínima de 6 meses'),
+        make_job(_job_experience='18 meses'),
+        make_job(),
+    ])
+
+    assert df['experience_years'].tolist()[:3] == [2, 0, 1]
+    assert pd.isna(df['experience_years'][3])
+
+
+def test_province():
+    df = normalize_jobs([
+        make_job(_job_location='Escazú'),
+        make_job(_job_location='Barva'),
+        make_job(_job_address='Puerto Limón, Limón'),
+    ])
+
+    assert df['province'].tolist() == ['San José', 'Heredia', 'Limón']
@@ -0,0 +1,93 @@
+import pytest
+
+import scraper as scraper_module
+from conftest import FakeResponse, make_job
+from scraper import ComputrabajoScraper
+
+BASE_URL = 'https://cr.computrabajo.com/empleos-en-san-jose'
+PAGE_SIZE = 4
+PAGES = 5
+
+
+def offer_number(page, card):
+    return (page - 1) * PAGE_SIZE + card + 1
+
+
+def listing_page(page):
+    cards = ''.join(
+        f'<article><a href="{make_job(offer_number(page, card))["_job_apply_url"]}">Oferta</a></article>'
+        for card in range(PAGE_SIZE)
+    )
+    return f'<html><body><div><h1>{PAGE_SIZE * PAGES} ofertas de trabajo</h1></div>{cards}</body></html>'
+
+
+class StubbedSite:
+    """Serves listing and detail pages, failing the detail pages in `broken`"""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.fetched = []
+
+    def fetch(self, url):
+        self.fetched.append(url)
+        if '/ofertas-de-trabajo/' in url:
+            n = int(url.rsplit('-', 1)[1], 16)
+            if n in self.broken:
+                raise ConnectionError(f"Could not fetch {url}")
+            return FakeResponse(url, f'<html><body><main><h1>Oferta {n}</h1></main></body></html>')
+        page = int(url.split('p=')[1]) if 'p=' in url else 1
+        return FakeResponse(url, listing_page(page))
+
+    def listing_pages(self):
+        return [url for url in self.fetched if '/ofertas-de-trabajo/' not in url]
+
+
+@pytest.fixture
+def site(monkeypatch):
+    monkeypatch.setattr(scraper_module.time, 'sleep', lambda seconds: None)
+    return StubbedSite()
+
+
+def scrape(site, **kwargs):
+    scraper = ComputrabajoScraper(max_workers=2, requests_per_second=1000)
+    scraper.fetch = site.fetch
+    return scraper.scrape_all_pages(BASE_URL, **kwargs)
+
+
+def titles(jobs):
+    return [job['_job_title'] for job in jobs]
+
+
+def test_only_planned_pages_are_fetched(site):
+    jobs = scrape(site, max_jobs=8)
+
+    assert titles(jobs) == [f'Oferta {n}' for n in range(1, 9)]
+    assert site.listing_pages() == [BASE_URL, f'{BASE_URL}?p=2']
+
+
+def test_skipped_jobs_are_made_up_from_further_pages(site):
+    site.broken = {offer_number(page, 0) for page in range(1, PAGES + 1)}
+
+    jobs = scrape(site, max_jobs=8)
+
+    assert len(jobs) == 8
+    assert site.listing_pages() == [BASE_URL, f'{BASE_URL}?p=2', f'{BASE_URL}?p=3']
+
+
+def test_listing_runs_out_before_max_jobs(site):
+    site.broken = {1, 2}
+    assert len(scrape(site, max_jobs=100)) == PAGE_SIZE * PAGES - 2
+
+
+def test_max_pages(site):
+    assert len(scrape(site, max_pages=2)) == PAGE_SIZE * 2
+    assert len(site.listing_pages()) == 2
+
+
+def test_listing_pages_are_fetched_in_windows(site):
+    jobs = scrape(site)
+
+    assert len(jobs) == PAGE_SIZE * PAGES
+    # With two workers, page 4 is only fetched once page 3's details are reached
+    first_detail_of_page_3 = site.fetched.index(make_job(offer_number(3, 0))['_job_apply_url'])
+    assert site.fetched.index(f'{BASE_URL}?p=4') > first_detail_of_page_3
@@ -0,0 +1,55 @@
+from conftest import make_job
+from search import JobSearchIndex, tokenize
+from storage import SQLiteJobStore
+
+JOBS = [
+    make_job(1, _job_title='Vendedora de tienda', _job_salary='350 000,00 ₡'),
+    make_job(2, _job_title='Cajero', _job_description='Atención de vendedores y clientes', _job_location='Escazú'),
+    make_job(3, _job_title='Bodeguero', _job_location='Barva', _job_address='Barva, Heredia',
+             _job_salary='1.200.000 - 1.500.000', _job_type='Medio Tiempo'),
+]
+
+
+def make_index(tmp_path, jobs=JOBS):
+    filename = str(tmp_path / 'jobs.db')
+    with SQLiteJobStore(filename) as store:
+        index = JobSearchIndex(filename)
+        index.update(store.upsert_jobs(jobs))
+    return index
+
+
+def titles(jobs):
+    return sorted(job['_job_title'] for job in jobs)
+
+
+def test_tokenize_folds_accents_and_stems():
+    assert tokenize('Vendedores de Limón') == ['vendedor', 'limon']
+    assert tokenize('vendedora') == tokenize('VENDEDOR')
+
+
+def test_text_search_matches_title_and_description(tmp_path):
+    with make_index(tmp_path) as index:
+        assert titles(index.search('vendedor')) == ['Cajero', 'Vendedora de tienda']
+        assert titles(index.search('bodeguero')) == ['Bodeguero']
+
+
+def test_location_matches_canton_and_province(tmp_path):
+    with make_index(tmp_path) as index:
+        assert titles(index.search(location='escazu')) == ['Cajero']
+        assert titles(index.search(location='Heredia')) == ['Bodeguero']
+        assert titles(index.search(location='San Jose')) == ['Cajero', 'Vendedora de tienda']
+
+
+def test_filters(tmp_path):
+    with make_index(tmp_path) as index:
+        assert titles(index.search(job_type='medio tiempo')) == ['Bodeguero']
+        assert titles(index.search(min_salary=1000000)) == ['Bodeguero']
+        assert titles(index.search(max_salary=400000)) == ['Vendedora de tienda']
+
+
+def test_update_replaces_indexed_job(tmp_path):
+    make_index(tmp_path).close()
+    with make_index(tmp_path, [make_job(3, _job_title='Chofer', _job_location='Alajuela')]) as index:
+        assert titles(index.search('bodeguero')) == []
+        assert titles(index.search('chofer', location='Alajuela')) == ['Chofer']
+        assert titles(index.search(location='Heredia')) == []
@@ -0,0 +1,65 @@
+from conftest import NEXT_PLACEHOLDER, PLACEHOLDER, make_job
+from job_record import JobRecord, offer_id
+from storage import SQLiteJobStore
+
+
+def make_store(tmp_path, **kwargs):
+    return SQLiteJobStore(str(tmp_path / 'jobs.db'), **kwargs)
+
+
+def test_upsert_returns_new_and_changed_jobs(tmp_path):
+    with make_store(tmp_path) as store:
+        inserted = store.upsert_jobs([make_job(1), make_job(2)], seen_at='2026-10-01 10:00:00')
+        assert inserted == [make_job(1), make_job(2)]
+
+        changed = store.upsert_jobs([make_job(1), make_job(2, _job_title='Cajero')], seen_at='2026-10-02 10:00:00')
+
+        assert changed == [make_job(2, _job_title='Cajero')]
+        assert store.get_job(offer_id(make_job(2)))['_job_title'] == 'Cajero'
+
+
+def test_unchanged_job_only_bumps_last_seen(tmp_path):
+    with make_store(tmp_path) as store:
+        store.upsert_jobs([make_job(1)], seen_at='2026-10-01 10:00:00')
+        store.upsert_jobs([make_job(1)], seen_at='2026-10-02 10:00:00')
+
+        row = store.conn.execute('SELECT first_seen, last_seen FROM jobs').fetchone()
+        assert tuple(row) == ('2026-10-01 10:00:00', '2026-10-02 10:00:00')
+
+
+def test_moving_placeholder_deadline_is_not_a_change(tmp_path):
+    moved = make_job(1, _job_expiry_date=NEXT_PLACEHOLDER, _job_application_deadline_date=NEXT_PLACEHOLDER)
+    with make_store(tmp_path) as store:
+        store.upsert_jobs([make_job(1)], default_deadlines={PLACEHOLDER})
+        assert store.upsert_jobs([moved], default_deadlines={NEXT_PLACEHOLDER}) == []
+
+
+def test_real_deadline_change_is_a_change(tmp_path):
+    with make_store(tmp_path) as store:
+        store.upsert_jobs([make_job(1)], default_deadlines={PLACEHOLDER})
+        real_deadline = make_job(1, _job_expiry_date='2026-12-15')
+        changed = store.upsert_jobs([real_deadline], default_deadlines={NEXT_PLACEHOLDER})
+
+        assert len(changed) == 1
+        assert store.get_job(offer_id(make_job(1)))['_job_expiry_date'] == '2026-12-15'
+
+
+def test_batches_and_duplicates(tmp_path):
+    jobs = [make_job(n) for n in range(1, 6)] + [make_job(3, _job_title='Última copia')]
+    with make_store(tmp_path, batch_size=2) as store:
+        store.upsert_jobs(jobs)
+
+        assert store.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0] == 5
+        assert store.get_job(offer_id(make_job(3)))['_job_title'] == 'Última copia'
+
+
+def test_job_records_and_queries(tmp_path):
+    with make_store(tmp_path) as store:
+        store.upsert_jobs([
+            JobRecord.from_dict(make_job(1)),
+            make_job(2, _job_location='Heredia'),
+            make_job(3, _job_filled='1'),
+        ])
+
+        assert [job['_job_title'] for job in store.find_jobs(location='Heredia')] == ['Oferta 2']
+        assert sorted(job['_job_title'] for job, first_seen in store.get_open_jobs()) == ['Oferta 1', 'Oferta 2']
@@ -0,0 +1,82 @@
+import os
+
+from bs4 import BeautifulSoup
+
+from conftest import make_job
+from scraper import ComputrabajoScraper
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'data', 'detail_jsonld.html')
+URL = make_job(1)['_job_apply_url']
+
+
+def read_fixture():
+    with open(FIXTURE, 'rb') as f:
+        return f.read()
+
+
+def structured(content):
+    return ComputrabajoScraper().get_structured_data(BeautifulSoup(content, 'html.parser'), content)
+
+
+def ld_page(posting):
+    return (
+        '<html><head><script type="application/ld+json">'
+        + posting
+        + '</script></head><body><main><h1>Oferta</h1></main></body></html>'
+    ).encode('utf-8')
+
+
+def test_job_posting_is_found_inside_graph():
+    posting = ComputrabajoScraper().get_job_posting(read_fixture())
+    assert posting['title'] == 'Asistente Comercial'
+
+
+def test_fields_from_fixture_page():
+    fields = structured(read_fixture())
+
+    assert fields['_job_title'] == 'Asistente Comercial'
+    assert fields['_job_description'] == 'Atención a clientes.\n\nFacturación\n\nCobros'
+    assert fields['_job_category'] == 'Ventas'
+    assert fields['_job_type'] == 'Tiempo Completo, Temporal'
+    assert fields['_job_expiry_date'] == '2026-12-01'
+    assert fields['_job_application_deadline_date'] == '2026-12-01'
+    assert fields['_job_salary'] == '450 000,00 ₡'
+    assert fields['_job_max_salary'] == '1 250 000,50 ₡'
+    assert fields['_job_salary_type'] == 'mensual'
+    assert fields['_job_experience'] == '2 años de experiencia'
+    assert fields['_job_qualification'] == 'Educación mínima: Bachillerato'
+    assert fields['_job_location'] == fields['_job_address'] == 'Escazú'
+    # No logo in hiringOrganization, so the og:image meta tag is used
+    assert fields['_job_featured_image'] == 'https://cr.computrabajo.com/logos/empresa.png'
+
+
+def test_salary_in_other_currency_and_short_experience():
+    fields = structured(ld_page(
+        '{"@type": "JobPosting", "baseSalary": {"currency": "USD", "value": "1500"},'
+        ' "experienceRequirements": {"monthsOfExperience": "6"},'
+        ' "hiringOrganization": {"logo": {"url": "https://example.com/logo.png"}}}'
+    ))
+
+    assert fields['_job_salary'] == fields['_job_max_salary'] == '1 500,00 USD'
+    assert '_job_salary_type' not in fields
+    assert fields['_job_experience'] == 'Menos de 1 año de experiencia'
+    assert fields['_job_featured_image'] == 'https://example.com/logo.png'
+
+
+def test_invalid_or_missing_json_ld_is_ignored():
+    assert structured(ld_page('{not json')) == {}
+    assert structured(ld_page('{"@type": "Organization", "name": "Empresa"}')) == {}
+    assert structured(ld_page('{"@type": "JobPosting", "validThrough": "pronto"}')) == {}
+
+
+def test_structured_values_win_and_are_counted():
+    scraper = ComputrabajoScraper()
+    job = scraper.extract_job_details(URL, read_fixture(), BeautifulSoup('', 'html.parser'))
+
+    assert job['_job_title'] == 'Asistente Comercial'
+    assert job['_job_expiry_date'] == '2026-12-01'
+    assert scraper.field_sources['_job_title', 'structured'] == 1
+    assert scraper.field_sources['_job_expiry_date', 'structured'] == 1
+    # Constant and card fields are never counted as heuristic hits
+    assert scraper.field_sources['_job_tag', 'heuristic'] == 0
+    assert scraper.field_sources['_job_featured', 'heuristic'] == 0